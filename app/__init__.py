@@ -0,0 +1,6 @@
+"""Tactical Command Center dashboard package."""
+
+import os
+
+# Repository root (the directory containing app/), resolved once for every module that builds paths from it
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
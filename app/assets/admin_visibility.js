@@ -0,0 +1,21 @@
+/* ========================================================
+   ADMIN AUTO-REFRESH — pause while the page is hidden
+   Disables the admin tab's dcc.Interval when the browser tab
+   is in the background and re-enables it when it is shown again.
+   Other dashboard tabs unmount the admin layout, which stops
+   the interval on its own.
+   ======================================================== */
+(function () {
+  "use strict";
+
+  const INTERVAL_ID = "admin-refresh-interval";
+  /* dcc.Interval renders no DOM node; this row is only present while the admin tab is mounted */
+  const ADMIN_MARKER_ID = "admin-system-metrics";
+
+  document.addEventListener("visibilitychange", function () {
+    const clientside = window.dash_clientside;
+    if (!clientside || typeof clientside.set_props !== "function") return;
+    if (!document.getElementById(ADMIN_MARKER_ID)) return;
+    clientside.set_props(INTERVAL_ID, { disabled: document.visibilityState === "hidden" });
+  });
+})();
@@ -1,5 +1,7 @@
 """Wrapper component with loading spinner for charts."""
 
+from functools import lru_cache
+
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 
@@ -15,6 +17,34 @@ GRAPH_CONFIG = {
     "displaylogo": False,
 }
 
+# Shared style dicts, reused by reference across every chart card
+_FLEX_CENTER = {"display": "flex", "alignItems": "center"}
+_LOADING_OVERLAY_STYLE = {
+    "visibility": "visible",
+    "opacity": 1,
+    "backgroundColor": "rgba(11, 15, 25, 0.75)",
+}
+_HEIGHT_STYLES = {}
+
+# Per-graph configs, built once per graph_id and shared across layout builds
+_CONFIG_CACHE = {}
+
+
+def get_graph_config(graph_id):
+    """Return the GRAPH_CONFIG variant whose PNG export is named after graph_id.
+
+    Configs are built once per graph_id and the same dict is returned on every
+    call, so graphs built outside chart_container() can share it too.
+    """
+    config = _CONFIG_CACHE.get(graph_id)
+    if config is None:
+        config = {
+            **GRAPH_CONFIG,
+            "toImageButtonOptions": {**GRAPH_CONFIG["toImageButtonOptions"], "filename": graph_id},
+        }
+        _CONFIG_CACHE[graph_id] = config
+    return config
+
 
 def chart_container(graph_id, title=None, height=450, info=None):
     """Wrap a dcc.Graph in a styled card with optional title and loading spinner.
@@ -27,37 +57,62 @@ def chart_container(graph_id, title=None, height=450, info=None):
 
     Returns:
         dbc.Card: Bootstrap card containing the titled graph with loading indicator.
+
+    Layouts call this with a small, fixed set of arguments, so the built
+    component tree is memoized and repeat calls return the same object.
     """
-    config = {**GRAPH_CONFIG, "toImageButtonOptions": {**GRAPH_CONFIG["toImageButtonOptions"], "filename": graph_id}}
-    children = []
-    if title:
-        if info:
-            icon_id = f"{graph_id}-info-icon"
-            children.append(
-                html.H5(
-                    [html.Span(title), html.I(className="bi bi-info-circle ms-2 chart-info-icon", id=icon_id)],
-                    className="chart-title",
-                    style={"display": "flex", "alignItems": "center"},
-                )
-            )
-            children.append(dbc.Tooltip(info, target=icon_id, placement="right"))
-        else:
-            children.append(html.H5(title, className="chart-title"))
-    children.append(
-        dcc.Loading(
-            dcc.Graph(id=graph_id, style={"height": f"{height}px"}, config=config),
-            type="default",
-            color="#38BDF8",
-            overlay_style={
-                "visibility": "visible",
-                "opacity": 1,
-                "backgroundColor": "rgba(11, 15, 25, 0.75)",
-            },
-        )
+    if title and info:
+        return _info_chart_container(graph_id, title, height, info)
+    return _plain_chart_container(graph_id, title, height)
+
+
+@lru_cache(maxsize=256)
+def _plain_chart_container(graph_id, title, height):
+    """Build the common chart card without an info tooltip."""
+    children = [html.H5(title, className="chart-title")] if title else []
+    children.append(_loading_graph(graph_id, height))
+    return _figure_card(children, title)
+
+
+@lru_cache(maxsize=128)
+def _info_chart_container(graph_id, title, height, info):
+    """Build a chart card whose title carries an info icon and tooltip."""
+    icon_id = f"{graph_id}-info-icon"
+    children = [
+        html.H5(
+            [html.Span(title), html.I(className="bi bi-info-circle ms-2 chart-info-icon", id=icon_id)],
+            className="chart-title",
+            style=_FLEX_CENTER,
+        ),
+        dbc.Tooltip(info, target=icon_id, placement="right"),
+        _loading_graph(graph_id, height),
+    ]
+    return _figure_card(children, title)
+
+
+def _loading_graph(graph_id, height):
+    """Build the dcc.Graph for graph_id wrapped in the themed loading spinner."""
+    height_style = _HEIGHT_STYLES.get(height)
+    if height_style is None:
+        height_style = _HEIGHT_STYLES[height] = {"height": f"{height}px"}
+    return dcc.Loading(
+        dcc.Graph(id=graph_id, style=height_style, config=get_graph_config(graph_id)),
+        type="default",
+        color="#38BDF8",
+        overlay_style=_LOADING_OVERLAY_STYLE,
     )
-    aria_label = f"{title} chart" if title else "Data visualization"
+
+
+def _figure_card(children, title):
+    """Wrap card body children in the accessible chart card container."""
     return html.Div(
         dbc.Card(dbc.CardBody(children), className="chart-card"),
         role="figure",
-        **{"aria-label": aria_label},
+        **{"aria-label": _chart_aria(title)},
     )
+
+
+@lru_cache(maxsize=128)
+def _chart_aria(title):
+    """Return the accessible label for a chart card titled title."""
+    return f"{title} chart" if title else "Data visualization"
@@ -1,8 +1,26 @@
 """Reusable KPI card component."""
 
+from functools import lru_cache
+
 import dash_bootstrap_components as dbc
 from dash import html
 
+# Title styles shared by every KPI card (with and without an info icon)
+_FLEX_CENTER_JUSTIFY = {"display": "flex", "alignItems": "center", "justifyContent": "center"}
+_EMPTY_STYLE = {}
+
+
+@lru_cache(maxsize=128)
+def _kpi_icon_id(title):
+    """Derive the info-icon component ID from a KPI title."""
+    return f"kpi-{title.lower().replace(' ', '-')}-info-icon"
+
+
+@lru_cache(maxsize=128)
+def _kpi_metric_aria(title):
+    """Return the accessible label for the KPI card wrapper."""
+    return f"{title} metric"
+
 
 def kpi_card(title, value, icon=None, color="#3498DB", info=None):
     """Create a styled KPI card component for dashboard metrics.
@@ -18,31 +36,21 @@ def kpi_card(title, value, icon=None, color="#3498DB", info=None):
         dbc.Card: Bootstrap card component with title, value, and optional tooltip.
     """
     title_children = [html.Span(title)]
-    tooltips = []
+    body = [
+        html.H6(title_children, className="kpi-title", style=_FLEX_CENTER_JUSTIFY if info else _EMPTY_STYLE),
+        html.H3(
+            value,
+            className="kpi-value",
+            style={"color": color},
+            **{"aria-label": f"{title}: {value}"},
+        ),
+    ]
     if info:
-        icon_id = f"kpi-{title.lower().replace(' ', '-')}-info-icon"
+        icon_id = _kpi_icon_id(title)
         title_children.append(html.I(className="bi bi-info-circle ms-2 chart-info-icon", id=icon_id))
-        tooltips.append(dbc.Tooltip(info, target=icon_id, placement="right"))
+        body.append(dbc.Tooltip(info, target=icon_id, placement="right"))
     return html.Div(
-        dbc.Card(
-            dbc.CardBody(
-                [
-                    html.H6(
-                        title_children,
-                        className="kpi-title",
-                        style={"display": "flex", "alignItems": "center", "justifyContent": "center"} if info else {},
-                    ),
-                    html.H3(
-                        value,
-                        className="kpi-value",
-                        style={"color": color},
-                        **{"aria-label": f"{title}: {value}"},
-                    ),
-                ]
-                + tooltips
-            ),
-            className="kpi-card",
-        ),
+        dbc.Card(dbc.CardBody(body), className="kpi-card"),
         role="status",
-        **{"aria-label": f"{title} metric"},
+        **{"aria-label": _kpi_metric_aria(title)},
     )
@@ -1,8 +1,14 @@
 """Application configuration: paths, constants, color palette."""
 
 import os
+import sys
+from types import MappingProxyType
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+import numpy as np
+
+from app import APP_ROOT
+
+BASE_DIR = APP_ROOT
 DATASET_DIR = os.path.join(BASE_DIR, "datasets")
 CACHE_DIR = os.path.join(BASE_DIR, "data_cache")
 
@@ -14,8 +20,9 @@ HEALTHCARE_CSV = os.path.join(DATASET_DIR, "healthcare_documentation", "Healthca
 
 # Cache paths
 ECG_CACHE = os.path.join(CACHE_DIR, "ecg_precomputed.json")
+ECG_ARRAYS_CACHE = os.path.join(CACHE_DIR, "ecg_waveforms.arrow")
 EQUIPMENT_CACHE = os.path.join(CACHE_DIR, "equipment.parquet")
-BASES_CACHE = os.path.join(CACHE_DIR, "bases.parquet")
+BASES_CACHE = os.path.join(CACHE_DIR, "bases.feather")
 HEALTHCARE_CACHE = os.path.join(CACHE_DIR, "healthcare.parquet")
 
 # Color palette — modern dark theme
@@ -131,7 +138,68 @@ FSC_CATEGORIES = {
 }
 
 
-# Simplified category mapping
+# Simplified equipment category by NSN prefix (first 2 digits = FSC group).
+# Exposed so DataFrame callers can use Series.map() instead of a per-row apply.
+NSN_PREFIX_TO_CATEGORY = {
+    "10": "Weapons & Firearms",
+    "11": "Weapons & Firearms",
+    "12": "Weapons & Firearms",
+    "13": "Ammunition & Explosives",
+    "14": "Weapons & Firearms",
+    "15": "Aircraft & Parts",
+    "16": "Aircraft & Parts",
+    "17": "Aircraft & Parts",
+    "19": "Ships & Marine",
+    "20": "Ships & Marine",
+    "22": "Vehicles & Transport",
+    "23": "Vehicles & Transport",
+    "24": "Vehicles & Transport",
+    "25": "Vehicles & Transport",
+    "26": "Vehicles & Transport",
+    "28": "Engines & Power",
+    "29": "Engines & Power",
+    "34": "Industrial Equipment",
+    "35": "Industrial Equipment",
+    "36": "Industrial Equipment",
+    "37": "Industrial Equipment",
+    "38": "Construction Equipment",
+    "39": "Construction Equipment",
+    "42": "Safety & Fire Equipment",
+    "49": "Maintenance Equipment",
+    "51": "Tools",
+    "52": "Tools",
+    "53": "Tools",
+    "58": "Communications & Electronics",
+    "59": "Communications & Electronics",
+    "60": "Communications & Electronics",
+    "61": "Communications & Electronics",
+    "65": "Medical Equipment",
+    "66": "Scientific Equipment",
+    "67": "Imaging Equipment",
+    "68": "Chemicals",
+    "69": "Training & Simulation",
+    "70": "IT & Computing",
+    "71": "Furniture & Supplies",
+    "72": "Furniture & Supplies",
+    "73": "Furniture & Supplies",
+    "74": "Office Equipment",
+    "75": "Office Equipment",
+    "84": "Clothing & Textiles",
+    "83": "Clothing & Textiles",
+    "85": "Personal Gear",
+}
+
+
+class _OtherDict(dict):
+    """Dict that returns "Other" for missing keys instead of raising KeyError."""
+
+    def __missing__(self, key):
+        return "Other"
+
+
+_CATEGORY_MAP_DEFAULT = _OtherDict(NSN_PREFIX_TO_CATEGORY)
+
+
 def get_equipment_category(nsn):
     """Map a National Stock Number (NSN) to a simplified equipment category.
 
@@ -143,58 +211,54 @@ def get_equipment_category(nsn):
         str: Category name (e.g., "Weapons & Firearms", "Vehicles & Transport"),
              or "Other" if the prefix is unrecognized or input is invalid.
     """
-    if not isinstance(nsn, str) or len(nsn) < 2:
+    # Short strings slice to a prefix that is never a key; non-strings raise TypeError
+    try:
+        return _CATEGORY_MAP_DEFAULT[nsn[:2]]
+    except TypeError:
         return "Other"
-    prefix = nsn[:2]
-    category_map = {
-        "10": "Weapons & Firearms",
-        "11": "Weapons & Firearms",
-        "12": "Weapons & Firearms",
-        "13": "Ammunition & Explosives",
-        "14": "Weapons & Firearms",
-        "15": "Aircraft & Parts",
-        "16": "Aircraft & Parts",
-        "17": "Aircraft & Parts",
-        "19": "Ships & Marine",
-        "20": "Ships & Marine",
-        "22": "Vehicles & Transport",
-        "23": "Vehicles & Transport",
-        "24": "Vehicles & Transport",
-        "25": "Vehicles & Transport",
-        "26": "Vehicles & Transport",
-        "28": "Engines & Power",
-        "29": "Engines & Power",
-        "34": "Industrial Equipment",
-        "35": "Industrial Equipment",
-        "36": "Industrial Equipment",
-        "37": "Industrial Equipment",
-        "38": "Construction Equipment",
-        "39": "Construction Equipment",
-        "42": "Safety & Fire Equipment",
-        "49": "Maintenance Equipment",
-        "51": "Tools",
-        "52": "Tools",
-        "53": "Tools",
-        "58": "Communications & Electronics",
-        "59": "Communications & Electronics",
-        "60": "Communications & Electronics",
-        "61": "Communications & Electronics",
-        "65": "Medical Equipment",
-        "66": "Scientific Equipment",
-        "67": "Imaging Equipment",
-        "68": "Chemicals",
-        "69": "Training & Simulation",
-        "70": "IT & Computing",
-        "71": "Furniture & Supplies",
-        "72": "Furniture & Supplies",
-        "73": "Furniture & Supplies",
-        "74": "Office Equipment",
-        "75": "Office Equipment",
-        "84": "Clothing & Textiles",
-        "83": "Clothing & Textiles",
-        "85": "Personal Gear",
-    }
-    return category_map.get(prefix, "Other")
+
+
+# 100-slot lookup table indexed by the integer NSN prefix (00-99)
+_CATEGORY_BY_PREFIX = np.full(100, "Other", dtype=object)
+for _prefix, _category in NSN_PREFIX_TO_CATEGORY.items():
+    _CATEGORY_BY_PREFIX[int(_prefix)] = _category
+
+# Category label per int8 code; group/filter on codes, look labels up for display
+EQUIPMENT_CATEGORY_LABELS = np.array(sorted(set(NSN_PREFIX_TO_CATEGORY.values())) + ["Other"], dtype=object)
+EQUIPMENT_CATEGORY_CODES = {label: code for code, label in enumerate(EQUIPMENT_CATEGORY_LABELS)}
+_CATEGORY_CODE_BY_PREFIX = np.array([EQUIPMENT_CATEGORY_CODES[c] for c in _CATEGORY_BY_PREFIX], dtype=np.int8)
+
+
+def _nsn_prefix_index(nsn):
+    """Return (clipped integer prefix, validity mask) for a Series of NSNs."""
+    import pandas as pd
+
+    prefix = pd.to_numeric(nsn.str.slice(0, 2), errors="coerce")
+    idx = prefix.fillna(-1).to_numpy(dtype=np.int64)
+    valid = (idx >= 0) & (idx < 100)
+    return np.clip(idx, 0, 99), valid
+
+
+def get_equipment_category_vec(nsn):
+    """Vectorized get_equipment_category() for a Series of NSN strings.
+
+    Converts the two-digit prefix to an integer once and gathers from a
+    100-entry table, so no Python callback or dict probe runs per row.
+
+    Args:
+        nsn: pd.Series of NSN strings (missing or malformed values allowed).
+
+    Returns:
+        np.ndarray: Category name per row, "Other" where unrecognized.
+    """
+    idx, valid = _nsn_prefix_index(nsn)
+    return np.where(valid, _CATEGORY_BY_PREFIX[idx], "Other")
+
+
+def get_equipment_category_codes(nsn):
+    """Like get_equipment_category_vec() but returns int8 codes into EQUIPMENT_CATEGORY_LABELS."""
+    idx, valid = _nsn_prefix_index(nsn)
+    return np.where(valid, _CATEGORY_CODE_BY_PREFIX[idx], EQUIPMENT_CATEGORY_CODES["Other"]).astype(np.int8)
 
 
 # US state abbreviation to full name mapping
@@ -393,5 +457,83 @@ STATE_POPULATION = {
     "AS": 49710,
 }
 
+# Populations as a contiguous array aligned with STATE_ABBREV_TO_NAME order, so
+# per-capita math is one index gather instead of a dict probe per row
+STATE_CODE_TO_IDX = {code: i for i, code in enumerate(STATE_ABBREV_TO_NAME)}
+STATE_POP_ARR = np.array([STATE_POPULATION[code] for code in STATE_ABBREV_TO_NAME], dtype=np.int64)
+
+# Parallel per-state attributes, all indexed by STATE_CODE_TO_IDX
+STATE_CODES = tuple(STATE_ABBREV_TO_NAME)
+STATE_NAMES = tuple(STATE_ABBREV_TO_NAME[code] for code in STATE_CODES)
+STATE_REGIONS = tuple(CENSUS_REGIONS.get(code, "Other") for code in STATE_CODES)
+STATE_REGION_COLORS = tuple(REGION_COLORS.get(region, COLORS["muted"]) for region in STATE_REGIONS)
+
+# Gather tables with one trailing slot for unrecognized codes (position -1)
+_STATE_NAME_GATHER = np.array(STATE_NAMES + (np.nan,), dtype=object)
+_STATE_REGION_GATHER = np.array(STATE_REGIONS + ("Other",), dtype=object)
+_STATE_POP_GATHER = np.append(STATE_POP_ARR.astype(np.float64), np.nan)
+
+
+def _state_positions(codes):
+    """Map a Series of state abbreviations to STATE_CODES positions, -1 if unknown."""
+    import pandas as pd
+
+    if isinstance(codes.dtype, pd.CategoricalDtype):
+        codes = codes.astype(object)
+    return codes.map(STATE_CODE_TO_IDX).fillna(-1).to_numpy(dtype=np.int64)
+
+
+def state_pop_vec(codes):
+    """Look up populations for a Series of state abbreviations.
+
+    Args:
+        codes: pd.Series of two-letter state codes.
+
+    Returns:
+        np.ndarray: float64 populations, NaN for unrecognized codes.
+    """
+    return _STATE_POP_GATHER[_state_positions(codes)]
+
+
+def state_lookup_vec(codes):
+    """Look up name, census region and population for a Series of state abbreviations.
+
+    Args:
+        codes: pd.Series of two-letter state codes.
+
+    Returns:
+        pd.DataFrame: name, region and population columns aligned with the input
+        index. Unrecognized codes get a NaN name and population and region "Other".
+    """
+    import pandas as pd
+
+    pos = _state_positions(codes)
+    return pd.DataFrame(
+        {
+            "name": _STATE_NAME_GATHER[pos],
+            "region": _STATE_REGION_GATHER[pos],
+            "population": _STATE_POP_GATHER[pos],
+        },
+        index=codes.index,
+    )
+
+
+def _frozen(mapping):
+    """Return a read-only view of mapping with its string keys interned."""
+    return MappingProxyType({sys.intern(k) if isinstance(k, str) else k: v for k, v in mapping.items()})
+
+
+# Lookup tables are shared, read-only module state: downstream modules read
+# them with .get() / Series.map() and must never mutate them. Interned keys
+# let repeated probes with the same short codes compare by identity.
+STATE_ABBREV_TO_NAME = _frozen(STATE_ABBREV_TO_NAME)
+STATE_NAME_TO_ABBREV = _frozen(STATE_NAME_TO_ABBREV)
+CENSUS_REGIONS = _frozen(CENSUS_REGIONS)
+STATE_POPULATION = _frozen(STATE_POPULATION)
+BRANCH_COLORS = _frozen(BRANCH_COLORS)
+FSC_CATEGORIES = _frozen(FSC_CATEGORIES)
+DEMIL_LABELS = _frozen(DEMIL_LABELS)
+
+
 # Plotly template defaults
 PLOTLY_TEMPLATE = "plotly_dark"
@@ -1,9 +1,14 @@
 """Centralized data loading with caching."""
 
+import contextlib
+import functools
 import json
 import os
-import sys
-import csv
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
 from app.config import (
@@ -13,28 +18,160 @@ from app.config import (
     HEALTHCARE_CSV,
     CACHE_DIR,
     ECG_CACHE,
+    ECG_ARRAYS_CACHE,
     EQUIPMENT_CACHE,
     BASES_CACHE,
     HEALTHCARE_CACHE,
+    EQUIPMENT_CATEGORY_LABELS,
+    get_equipment_category_codes,
 )
 from app.logging_config import get_logger
+from app.settings import DASH_CACHE_MAX_MB
 from app import metrics
 
 logger = get_logger(__name__)
 
-# Increase CSV field size limit for GeoJSON polygons
-csv.field_size_limit(sys.maxsize)
 
-_cache = {}
+class _DatasetCache(OrderedDict):
+    """In-memory dataset cache that drops least recently used entries over a byte budget.
+
+    Only DataFrames count toward the budget; the ECG arrays are mostly views
+    into the memory-mapped sidecar. A budget of 0 disables eviction. Each
+    entry's size is measured once on insert and kept in ``_sizes``.
+    """
+
+    def __init__(self, max_bytes=0):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self._sizes = {}
+        self._total = 0
+        # Loaders for different datasets insert and evict concurrently
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def get(self, key, default=None):
+        """Return the entry for key (marking it recently used), or default."""
+        with self._lock:
+            if not super().__contains__(key):
+                return default
+            return self[key]
+
+    def peek(self, key, default=None):
+        """Return the entry for key without changing its recency."""
+        return super().get(key, default)
+
+    def __setitem__(self, key, value):
+        nbytes = _frame_nbytes(value)
+        with self._lock:
+            self._total += nbytes - self._sizes.get(key, 0)
+            self._sizes[key] = nbytes
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if self.max_bytes:
+                self._evict()
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+            self._total -= self._sizes.pop(key, 0)
+
+    def pop(self, key, *default):
+        with self._lock:
+            if super().__contains__(key):
+                self._total -= self._sizes.pop(key, 0)
+            return super().pop(key, *default)
+
+    def popitem(self, last=True):
+        with self._lock:
+            key, value = super().popitem(last=last)
+            self._total -= self._sizes.pop(key, 0)
+            return key, value
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            self._sizes.clear()
+            self._total = 0
+
+    def _evict(self):
+        # The newest entry is always kept, even if it alone exceeds the budget
+        while self._total > self.max_bytes and len(self) > 1:
+            key, _ = self.popitem(last=False)
+            logger.info("Evicted %s from memory cache (budget %d MB)", key, self.max_bytes >> 20)
+
+
+def _frame_nbytes(value):
+    """Return the deep memory footprint of a cached DataFrame, or 0 for anything else."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    return 0
+
+
+_cache = _DatasetCache(DASH_CACHE_MAX_MB << 20)
+
+# One lock per dataset, so concurrent first requests parse each source only once
+_load_locks = {key: threading.Lock() for key in ("equipment", "bases", "healthcare", "ecg")}
+
+# Parquet cache write settings: zstd with dictionary-encoded columns suits the
+# heavily repeated agency, item and state strings
+_PARQUET_OPTIONS = {
+    "engine": "pyarrow",
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "row_group_size": 256_000,
+}
+
+
+def _strip_repeated(series):
+    """Strip whitespace from a low-cardinality string column once per distinct value.
+
+    The column keeps its object dtype (missing values stay NaN), so filters and
+    groupbys downstream behave exactly as with Series.str.strip().
+    """
+    codes, uniques = pd.factorize(series)
+    stripped = np.append(uniques.str.strip().to_numpy(dtype=object), np.nan)
+    return pd.Series(stripped[codes], index=series.index, name=series.name)
+
+
+def _single_flight(key):
+    """Serialize calls to a dataset loader; later callers then hit the memory cache."""
+
+    def decorator(load):
+        @functools.wraps(load)
+        def wrapper():
+            with _load_locks[key]:
+                return load()
+
+        return wrapper
+
+    return decorator
+
+
+def warm_caches():
+    """Load the equipment, bases and healthcare datasets concurrently.
+
+    CSV parsing and Parquet reads release the GIL, so the three loads overlap
+    instead of running back to back on the first page views.
+    """
+    loaders = (load_equipment, load_bases, load_healthcare)
+    with ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix="cache-warm") as pool:
+        for future in [pool.submit(load) for load in loaders]:
+            future.result()
+    logger.info("Dataset caches warmed")
 
 
 def _cache_is_fresh(cache_path, source_path):
     """Check if a cache file exists and is newer than its source CSV."""
-    if not os.path.exists(cache_path):
-        return False
-    if not os.path.exists(source_path):
+    try:
+        return os.stat(cache_path).st_mtime >= os.stat(source_path).st_mtime
+    except OSError:
         return False
-    return os.path.getmtime(cache_path) >= os.path.getmtime(source_path)
 
 
 # Empty fallback structures for error paths
@@ -69,22 +206,26 @@ def validate_dataframe(df, required_columns, name="DataFrame"):
     return True
 
 
+@_single_flight("equipment")
 def load_equipment():
     """Load and preprocess military equipment data.
 
     Returns:
         pd.DataFrame: Processed equipment data, or empty DataFrame on error.
     """
-    if "equipment" in _cache:
+    cached = _cache.get("equipment")
+    if cached is not None:
         metrics.increment("cache_hits", labels={"dataset": "equipment", "layer": "memory"})
-        return _cache["equipment"]
+        return cached
 
     # Try persistent Parquet cache first
     if _cache_is_fresh(EQUIPMENT_CACHE, EQUIPMENT_CSV):
         try:
             logger.info("Loading equipment from Parquet cache: %s", EQUIPMENT_CACHE)
             with metrics.timer("data_load_seconds", {"dataset": "equipment", "source": "parquet"}):
-                df = pd.read_parquet(EQUIPMENT_CACHE)
+                # Restores NSN as an Arrow-backed string, as read from the CSV
+                with pd.option_context("mode.string_storage", "pyarrow"):
+                    df = pd.read_parquet(EQUIPMENT_CACHE)
             metrics.increment("cache_hits", labels={"dataset": "equipment", "layer": "parquet"})
             _cache["equipment"] = df
             return df
@@ -95,13 +236,26 @@ def load_equipment():
     try:
         metrics.increment("cache_misses", labels={"dataset": "equipment"})
         logger.info("Loading equipment data from %s", EQUIPMENT_CSV)
+        # No quoted newlines in this file, so pyarrow's multithreaded reader applies
         df = pd.read_csv(
             EQUIPMENT_CSV,
-            low_memory=False,
+            engine="pyarrow",
+            # Only the columns something downstream reads; others (e.g. "DEMIL IC", "UI") are skipped
+            usecols=[
+                "State",
+                "Agency Name",
+                "NSN",
+                "Item Name",
+                "Quantity",
+                "Acquisition Value",
+                "DEMIL Code",
+                "Ship Date",
+                "Station Type",
+            ],
             dtype={
                 "State": "category",
                 "Agency Name": str,
-                "NSN": str,
+                "NSN": "string[pyarrow]",
                 "Item Name": str,
                 "DEMIL Code": str,
                 "Station Type": str,
@@ -124,71 +278,28 @@ def load_equipment():
             name="Equipment",
         )
 
-        df["Agency Name"] = df["Agency Name"].str.strip()
+        # Agency, DEMIL code and station type repeat across ~130K rows; kept as categoricals
+        df["Agency Name"] = _strip_repeated(df["Agency Name"]).astype("category")
         df["Acquisition Value"] = pd.to_numeric(df["Acquisition Value"], errors="coerce").fillna(0)
         df["Quantity"] = pd.to_numeric(df["Quantity"], errors="coerce").fillna(0).astype(int)
-        df["Ship Date"] = pd.to_datetime(df["Ship Date"], errors="coerce")
+        # pyarrow usually parses this column during the read already; if any value
+        # blocks that, the strings are ISO 8601 and take pandas' fast ISO path
+        df["Ship Date"] = pd.to_datetime(df["Ship Date"], format="ISO8601", errors="coerce")
         df["Year"] = df["Ship Date"].dt.year
-        # Vectorized category mapping using NSN prefix lookup
-        nsn_prefix = df["NSN"].str[:2].fillna("")
-        category_map = {
-            "10": "Weapons & Firearms",
-            "11": "Weapons & Firearms",
-            "12": "Weapons & Firearms",
-            "13": "Ammunition & Explosives",
-            "14": "Weapons & Firearms",
-            "15": "Aircraft & Parts",
-            "16": "Aircraft & Parts",
-            "17": "Aircraft & Parts",
-            "19": "Ships & Marine",
-            "20": "Ships & Marine",
-            "22": "Vehicles & Transport",
-            "23": "Vehicles & Transport",
-            "24": "Vehicles & Transport",
-            "25": "Vehicles & Transport",
-            "26": "Vehicles & Transport",
-            "28": "Engines & Power",
-            "29": "Engines & Power",
-            "34": "Industrial Equipment",
-            "35": "Industrial Equipment",
-            "36": "Industrial Equipment",
-            "37": "Industrial Equipment",
-            "38": "Construction Equipment",
-            "39": "Construction Equipment",
-            "42": "Safety & Fire Equipment",
-            "49": "Maintenance Equipment",
-            "51": "Tools",
-            "52": "Tools",
-            "53": "Tools",
-            "58": "Communications & Electronics",
-            "59": "Communications & Electronics",
-            "60": "Communications & Electronics",
-            "61": "Communications & Electronics",
-            "65": "Medical Equipment",
-            "66": "Scientific Equipment",
-            "67": "Imaging Equipment",
-            "68": "Chemicals",
-            "69": "Training & Simulation",
-            "70": "IT & Computing",
-            "71": "Furniture & Supplies",
-            "72": "Furniture & Supplies",
-            "73": "Furniture & Supplies",
-            "74": "Office Equipment",
-            "75": "Office Equipment",
-            "84": "Clothing & Textiles",
-            "83": "Clothing & Textiles",
-            "85": "Personal Gear",
-        }
-        df["Category"] = nsn_prefix.map(category_map).fillna("Other").astype("category")
-        df["DEMIL Code"] = df["DEMIL Code"].fillna("Unknown").str.strip()
-        df["Station Type"] = df["Station Type"].fillna("Unknown").str.strip()
+        # Category codes come from a 100-entry table indexed by the integer NSN
+        # prefix; only categories that actually occur are kept
+        df["Category"] = pd.Categorical.from_codes(
+            get_equipment_category_codes(df["NSN"]), categories=EQUIPMENT_CATEGORY_LABELS
+        ).remove_unused_categories()
+        df["DEMIL Code"] = _strip_repeated(df["DEMIL Code"].fillna("Unknown")).astype("category")
+        df["Station Type"] = _strip_repeated(df["Station Type"].fillna("Unknown")).astype("category")
 
         logger.info("Equipment data loaded: %d rows", len(df))
         _cache["equipment"] = df
         # Persist to Parquet cache
         try:
             os.makedirs(CACHE_DIR, exist_ok=True)
-            df.to_parquet(EQUIPMENT_CACHE, index=False)
+            df.to_parquet(EQUIPMENT_CACHE, index=False, **_PARQUET_OPTIONS)
             logger.info("Equipment cache written: %s", EQUIPMENT_CACHE)
         except Exception:
             logger.warning("Failed to write equipment cache")
@@ -216,30 +327,32 @@ def load_equipment():
             "Year",
             "Category",
             "Station Type",
-            "UI",
         ]
     )
     _cache["equipment"] = empty
     return empty
 
 
+@_single_flight("bases")
 def load_bases():
     """Load and preprocess military bases data.
 
     Returns:
         pd.DataFrame: Processed bases data, or empty DataFrame on error.
     """
-    if "bases" in _cache:
+    cached = _cache.get("bases")
+    if cached is not None:
         metrics.increment("cache_hits", labels={"dataset": "bases", "layer": "memory"})
-        return _cache["bases"]
+        return cached
 
-    # Try persistent Parquet cache first
+    # Try persistent Feather cache first
     if _cache_is_fresh(BASES_CACHE, BASES_CSV):
         try:
-            logger.info("Loading bases from Parquet cache: %s", BASES_CACHE)
-            with metrics.timer("data_load_seconds", {"dataset": "bases", "source": "parquet"}):
-                df = pd.read_parquet(BASES_CACHE)
-            metrics.increment("cache_hits", labels={"dataset": "bases", "layer": "parquet"})
+            logger.info("Loading bases from Feather cache: %s", BASES_CACHE)
+            with metrics.timer("data_load_seconds", {"dataset": "bases", "source": "feather"}):
+                with pd.option_context("mode.string_storage", "pyarrow"):
+                    df = pd.read_feather(BASES_CACHE)
+            metrics.increment("cache_hits", labels={"dataset": "bases", "layer": "feather"})
             _cache["bases"] = df
             return df
         except Exception:
@@ -253,10 +366,20 @@ def load_bases():
             BASES_CSV,
             sep=";",
             encoding="utf-8-sig",
-            engine="python",
+            # Skips the Geo Shape polygons and the unused id/shape columns
+            usecols=[
+                "Geo Point",
+                "COMPONENT",
+                "Site Name",
+                "State Terr",
+                "Oper Stat",
+                "Joint Base",
+                "AREA",
+                "PERIMETER",
+            ],
             dtype={
                 "COMPONENT": str,
-                "Site Name": str,
+                "Site Name": "string[pyarrow]",
                 "State Terr": str,
                 "Oper Stat": str,
                 "Joint Base": str,
@@ -270,7 +393,7 @@ def load_bases():
         )
 
         # Vectorized Geo Point parsing (replaces row-wise .apply())
-        geo = df["Geo Point"].dropna().str.split(",", expand=True)
+        geo = df["Geo Point"].dropna().str.split(",", n=1, expand=True)
         if len(geo.columns) >= 2:
             df["lat"] = pd.to_numeric(geo[0].str.strip(), errors="coerce")
             df["lon"] = pd.to_numeric(geo[1].str.strip(), errors="coerce")
@@ -280,10 +403,11 @@ def load_bases():
         df = df.dropna(subset=["lat", "lon"]).copy()
 
         # Normalize component names
-        df["COMPONENT"] = df["COMPONENT"].str.strip()
-        df["Oper Stat"] = df["Oper Stat"].fillna("Unknown").str.strip()
-        df["Joint Base"] = df["Joint Base"].fillna("Not Joint").str.strip()
-        df["State Terr"] = df["State Terr"].fillna("Unknown").str.strip()
+        df["COMPONENT"] = _strip_repeated(df["COMPONENT"])
+        df["Oper Stat"] = _strip_repeated(df["Oper Stat"].fillna("Unknown"))
+        df["Joint Base"] = _strip_repeated(df["Joint Base"].fillna("Not Joint"))
+        df["State Terr"] = _strip_repeated(df["State Terr"].fillna("Unknown"))
+        # Near-unique, so stripped per row, but as Arrow strings in one C pass
         df["Site Name"] = df["Site Name"].fillna("Unknown").str.strip()
         # Clean numeric columns for AREA and PERIMETER
         df["AREA"] = pd.to_numeric(df["AREA"], errors="coerce").fillna(0)
@@ -291,10 +415,10 @@ def load_bases():
 
         logger.info("Bases data loaded: %d rows", len(df))
         _cache["bases"] = df
-        # Persist to Parquet cache
+        # Persist to Feather cache: uncompressed Arrow IPC, read back without decoding
         try:
             os.makedirs(CACHE_DIR, exist_ok=True)
-            df.to_parquet(BASES_CACHE, index=False)
+            df.reset_index(drop=True).to_feather(BASES_CACHE, compression="uncompressed")
             logger.info("Bases cache written: %s", BASES_CACHE)
         except Exception:
             logger.warning("Failed to write bases cache")
@@ -326,15 +450,41 @@ def load_bases():
     return empty
 
 
+def _read_healthcare_csv():
+    """Read the healthcare CSV with pyarrow's multithreaded reader.
+
+    pandas' pyarrow engine rejects the quoted newlines in the transcriptions,
+    so pyarrow.csv is called directly with newlines_in_values enabled. Parse
+    failures are raised as pd.errors.ParserError, like pd.read_csv.
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    try:
+        table = pa_csv.read_csv(
+            HEALTHCARE_CSV,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                strings_can_be_null=True,
+                column_types={"medical_specialty": pa.dictionary(pa.int32(), pa.string())},
+            ),
+        )
+    except pa.ArrowInvalid as e:
+        raise pd.errors.ParserError(str(e)) from e
+    return table.to_pandas()
+
+
+@_single_flight("healthcare")
 def load_healthcare():
     """Load and preprocess healthcare documentation data.
 
     Returns:
         pd.DataFrame: Processed healthcare data, or empty DataFrame on error.
     """
-    if "healthcare" in _cache:
+    cached = _cache.get("healthcare")
+    if cached is not None:
         metrics.increment("cache_hits", labels={"dataset": "healthcare", "layer": "memory"})
-        return _cache["healthcare"]
+        return cached
 
     # Try persistent Parquet cache first
     if _cache_is_fresh(HEALTHCARE_CACHE, HEALTHCARE_CSV):
@@ -352,17 +502,7 @@ def load_healthcare():
     try:
         metrics.increment("cache_misses", labels={"dataset": "healthcare"})
         logger.info("Loading healthcare data from %s", HEALTHCARE_CSV)
-        df = pd.read_csv(
-            HEALTHCARE_CSV,
-            low_memory=False,
-            dtype={
-                "medical_specialty": "category",
-                "sample_name": str,
-                "description": str,
-                "keywords": str,
-                "cleaned_transcription": str,
-            },
-        )
+        df = _read_healthcare_csv()
 
         validate_dataframe(
             df,
@@ -380,7 +520,7 @@ def load_healthcare():
         # Persist to Parquet cache
         try:
             os.makedirs(CACHE_DIR, exist_ok=True)
-            df.to_parquet(HEALTHCARE_CACHE, index=False)
+            df.to_parquet(HEALTHCARE_CACHE, index=False, **_PARQUET_OPTIONS)
             logger.info("Healthcare cache written: %s", HEALTHCARE_CACHE)
         except Exception:
             logger.warning("Failed to write healthcare cache")
@@ -410,18 +550,20 @@ def load_healthcare():
     return empty
 
 
+@_single_flight("ecg")
 def load_ecg_precomputed():
     """Load precomputed ECG data from cache.
 
     Returns:
         dict: Precomputed ECG statistics, or empty structure on error.
     """
-    if "ecg" in _cache:
+    cached = _cache.get("ecg")
+    if cached is not None:
         metrics.increment("cache_hits", labels={"dataset": "ecg", "layer": "memory"})
-        return _cache["ecg"]
+        return cached
 
     try:
-        if not os.path.exists(ECG_CACHE):
+        if not (os.path.exists(ECG_CACHE) and os.path.exists(ECG_ARRAYS_CACHE)):
             logger.info("ECG cache not found, running precomputation...")
             result = _precompute_ecg()
             if result is None:
@@ -431,6 +573,7 @@ def load_ecg_precomputed():
 
         with open(ECG_CACHE, "r") as f:
             data = json.load(f)
+        data = _attach_ecg_arrays(data)
         _cache["ecg"] = data
         return data
 
@@ -447,6 +590,240 @@ def load_ecg_precomputed():
     return _EMPTY_ECG
 
 
+def _read_ecg_csv(fpath):
+    """Read a headerless, all-numeric ECG CSV into a float32 matrix.
+
+    Uses pyarrow's multithreaded CSV reader and stacks the columns directly,
+    skipping the intermediate DataFrame. The last column is the class label.
+    """
+    from pyarrow import csv as pa_csv
+
+    table = pa_csv.read_csv(fpath, read_options=pa_csv.ReadOptions(autogenerate_column_names=True, block_size=8 << 20))
+    return np.column_stack([column.to_numpy().astype(np.float32, copy=False) for column in table.columns])
+
+
+# Per-class waveform arrays stored in the Arrow sidecar rather than in the JSON cache
+_ECG_ARRAY_FIELDS = ("mean_waveforms", "std_waveforms", "samples")
+# PCA embedding coordinates, also stored in the sidecar
+_PCA_ARRAY_FIELDS = ("x", "y")
+
+# Sampled beats are normalized to [0, 1] and only plotted, so they are stored
+# as 8-bit levels; mean/std waveforms stay float32
+_SAMPLE_LEVELS = 255
+
+
+def _write_ecg_cache(result):
+    """Write precomputed ECG data as a JSON document plus an Arrow IPC file of waveform arrays.
+
+    In the JSON, each per-class waveform array is replaced by its key in the
+    sidecar, and the top-level "_arrays" entry names the sidecar file. The
+    sidecar holds one row per array: key, dtype, shape and the raw bytes.
+    """
+    arrays = {}
+    doc = {"_arrays": os.path.basename(ECG_ARRAYS_CACHE)}
+    for dataset_name, ds in result.items():
+        splits = {}
+        for split_name, split in ds["splits"].items():
+            split_doc = dict(split)
+            for field in _ECG_ARRAY_FIELDS:
+                keys = {}
+                for i, (class_name, arr) in enumerate(split[field].items()):
+                    key = f"{dataset_name}.{split_name}.{field}.{i}"
+                    if field == "samples":
+                        arrays[key] = np.round(np.clip(arr, 0.0, 1.0) * _SAMPLE_LEVELS).astype(np.uint8)
+                    else:
+                        arrays[key] = np.asarray(arr, dtype=np.float32)
+                    keys[class_name] = key
+                split_doc[field] = keys
+            splits[split_name] = split_doc
+        doc[dataset_name] = {**ds, "splits": splits}
+        if "pca_embedding" in ds:
+            pca_doc = dict(ds["pca_embedding"])
+            for axis in _PCA_ARRAY_FIELDS:
+                key = f"{dataset_name}.pca.{axis}"
+                arrays[key] = np.asarray(pca_doc[axis], dtype=np.float32)
+                pca_doc[axis] = key
+            doc[dataset_name]["pca_embedding"] = pca_doc
+
+    import pyarrow as pa
+
+    table = pa.table(
+        {
+            "key": list(arrays),
+            "dtype": [arr.dtype.str for arr in arrays.values()],
+            "shape": [list(arr.shape) for arr in arrays.values()],
+            "data": pa.array([arr.tobytes() for arr in arrays.values()], type=pa.binary()),
+        }
+    )
+    # Sidecar first, then the JSON that points at it; each replaces the old file atomically, so
+    # readers never see a partial file and other workers' memory maps keep the old inode
+    with _atomic_path(ECG_ARRAYS_CACHE) as tmp_path:
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    with _atomic_path(ECG_CACHE) as tmp_path:
+        with open(tmp_path, "w") as f:
+            json.dump(doc, f)
+
+
+@contextlib.contextmanager
+def _atomic_path(path):
+    """Yield a temporary path next to path and move it over path once the block succeeds."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _attach_ecg_arrays(data):
+    """Swap the sidecar keys in a loaded ECG cache for their float32 arrays.
+
+    Documents without an "_arrays" entry hold plain lists and are returned
+    unchanged.
+    """
+    sidecar = data.pop("_arrays", None)
+    if sidecar is None:
+        return data
+    arrays = _read_ecg_arrays(os.path.join(os.path.dirname(ECG_CACHE), sidecar))
+    for ds in data.values():
+        for split in ds["splits"].values():
+            for field in _ECG_ARRAY_FIELDS:
+                split[field] = {class_name: arrays[key] for class_name, key in split[field].items()}
+        if "pca_embedding" in ds:
+            for axis in _PCA_ARRAY_FIELDS:
+                ds["pca_embedding"][axis] = arrays[ds["pca_embedding"][axis]]
+    return data
+
+
+def _read_ecg_arrays(path):
+    """Memory-map the Arrow sidecar and return {key: float32 array}.
+
+    float32 waveforms are read-only views straight into the mapped file;
+    8-bit quantized beats are expanded to float32 copies.
+    """
+    import pyarrow as pa
+
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    data = table.column("data").combine_chunks()
+    offsets = np.frombuffer(data.buffers()[1], dtype=np.int32, count=len(data) + 1, offset=data.offset * 4)
+    raw = data.buffers()[2]
+
+    arrays = {}
+    for i, (key, dtype, shape) in enumerate(
+        zip(table.column("key").to_pylist(), table.column("dtype").to_pylist(), table.column("shape").to_pylist())
+    ):
+        arr = np.frombuffer(raw, dtype=dtype, count=int(np.prod(shape)), offset=int(offsets[i])).reshape(shape)
+        arrays[key] = arr.astype(np.float32) / _SAMPLE_LEVELS if arr.dtype == np.uint8 else arr
+    return arrays
+
+
+def _ecg_split_stats(signals, labels, class_map, rng):
+    """Compute per-class statistics, samples and features for one ECG split.
+
+    Rows are sorted by label once, so each class is a contiguous block and
+    every per-class statistic is a single np.add.reduceat over the matrix
+    instead of one masked pass per class.
+
+    Args:
+        signals: float32 array of shape (n_beats, n_samples).
+        labels: int8 array of class ids, one per row of signals.
+        class_map: Mapping of class id to display name.
+        rng: np.random.Generator used to draw the sample waveforms.
+
+    Returns:
+        dict: class_distribution, mean/std waveforms, samples and features keyed by class name.
+    """
+    split_data = {
+        "class_distribution": {},
+        "mean_waveforms": {},
+        "std_waveforms": {},
+        "samples": {},
+        "features": {},
+    }
+    if len(labels) == 0:
+        return split_data
+
+    # Stable sort of int8 labels is a radix sort; block offsets follow from the counts
+    order = np.argsort(labels, kind="stable")
+    sorted_signals = signals[order]
+    class_ids, counts = np.unique(labels, return_counts=True)
+    starts = np.cumsum(counts) - counts
+
+    squared = sorted_signals * sorted_signals
+    means = np.add.reduceat(sorted_signals, starts, axis=0, dtype=np.float64) / counts[:, None]
+    mean_squares = np.add.reduceat(squared, starts, axis=0, dtype=np.float64) / counts[:, None]
+    stds = np.sqrt(np.maximum(mean_squares - means**2, 0.0))
+
+    # Per-beat features, averaged per class
+    peak = np.add.reduceat(sorted_signals.max(axis=1), starts, dtype=np.float64) / counts
+    energy = np.add.reduceat(squared.sum(axis=1, dtype=np.float64), starts) / counts
+    # int8 sign of (signal - 0.5) from two comparisons; avoids float temporaries
+    signs = (sorted_signals > 0.5).view(np.int8) - (sorted_signals < 0.5).view(np.int8)
+    crossings = np.count_nonzero(np.diff(signs, axis=1), axis=1)
+    zero_crossings = np.add.reduceat(crossings, starts) / counts
+
+    for i, class_id in enumerate(class_ids.tolist()):
+        class_name = class_map.get(class_id, f"Class {class_id}")
+        count = int(counts[i])
+        class_signals = sorted_signals[starts[i] : starts[i] + count]
+
+        split_data["class_distribution"][class_name] = count
+        split_data["mean_waveforms"][class_name] = means[i].astype(np.float32)
+        split_data["std_waveforms"][class_name] = stds[i].astype(np.float32)
+
+        # Sample 50 waveforms per class
+        # shuffle=False skips permuting the drawn indices; only the subset matters
+        idx = rng.choice(count, min(50, count), replace=False, shuffle=False)
+        split_data["samples"][class_name] = class_signals[idx]
+
+        split_data["features"][class_name] = {
+            "peak_amplitude": float(peak[i]),
+            "energy": float(energy[i]),
+            "zero_crossings": float(zero_crossings[i]),
+        }
+
+    return split_data
+
+
+def _pca_2d(matrix):
+    """Project rows onto their first two principal components.
+
+    A thin SVD of the centered float32 matrix (a few hundred sampled beats),
+    with component signs fixed so the largest loading of each is positive.
+
+    Returns:
+        tuple: (n_rows, 2) embedding and the two explained variance ratios.
+    """
+    centered = matrix - matrix.mean(axis=0)
+    u, s, vt = np.linalg.svd(centered, full_matrices=False)
+    signs = np.sign(vt[np.arange(2), np.abs(vt[:2]).argmax(axis=1)])
+    embedding = u[:, :2] * (s[:2] * signs)
+    variance = s**2
+    return embedding, variance[:2] / variance.sum()
+
+
+def _ecg_source_path(fname, present):
+    """Return the path of an ECG source file, its _sample variant, or None if neither exists.
+
+    Args:
+        fname: Full dataset file name, e.g. "mitbih_train.csv".
+        present: Set of file names found in ECG_DIR.
+    """
+    if fname in present:
+        return os.path.join(ECG_DIR, fname)
+    sample_fname = fname.replace(".csv", "_sample.csv")
+    if sample_fname in present:
+        logger.info("Using sample data: %s (full dataset not found)", sample_fname)
+        return os.path.join(ECG_DIR, sample_fname)
+    return None
+
+
 def _precompute_ecg():
     """Precompute ECG statistics and samples.
 
@@ -457,28 +834,52 @@ def _precompute_ecg():
         os.makedirs(CACHE_DIR, exist_ok=True)
         result = {}
 
-        for dataset_name, files, class_map in [
+        datasets = [
             (
                 "mitbih",
                 ["mitbih_train.csv", "mitbih_test.csv"],
                 {0: "Normal (N)", 1: "Supraventricular (S)", 2: "Ventricular (V)", 3: "Fusion (F)", 4: "Unknown (Q)"},
             ),
             ("ptbdb", ["ptbdb_normal.csv", "ptbdb_abnormal.csv"], {0: "Normal", 1: "Abnormal"}),
-        ]:
-            dfs = {}
-            for fname in files:
-                fpath = os.path.join(ECG_DIR, fname)
-
-                # Try full dataset first, fall back to sample if not available
-                if not os.path.exists(fpath):
-                    # Try sample version
-                    sample_fname = fname.replace(".csv", "_sample.csv")
-                    fpath = os.path.join(ECG_DIR, sample_fname)
-                    if os.path.exists(fpath):
-                        logger.info("Using sample data: %s (full dataset not found)", sample_fname)
-
-                if os.path.exists(fpath):
-                    df = pd.read_csv(fpath, header=None)
+        ]
+
+        # The source files are independent and pyarrow parses without holding
+        # the GIL, so all of them are read concurrently up front
+        # One directory listing instead of an exists() probe per candidate file
+        try:
+            with os.scandir(ECG_DIR) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            present = set()
+        paths = {fname: _ecg_source_path(fname, present) for _, files, _ in datasets for fname in files}
+        paths = {fname: fpath for fname, fpath in paths.items() if fpath}
+        with ThreadPoolExecutor(max_workers=max(len(paths), 1)) as pool:
+            matrices = dict(zip(paths, pool.map(_read_ecg_csv, paths.values())))
+
+        for dataset_name, files, class_map in datasets:
+            ds_result = {"class_names": class_map, "splits": {}}
+
+            # For PTB, combine normal and abnormal into train/test splits
+            if dataset_name == "ptbdb" and all(fname in matrices for fname in files):
+                normal, abnormal = (matrices[fname] for fname in files)
+
+                # Label: normal=0, abnormal=1, built from the row counts
+                labels = np.repeat(np.array([0, 1], dtype=np.int8), [len(normal), len(abnormal)])
+                signals = np.concatenate([normal[:, :-1], abnormal[:, :-1]])
+
+                # 80/20 split
+                rng = np.random.default_rng(42)
+                idx = rng.permutation(len(labels))
+                split_point = int(0.8 * len(idx))
+                train_idx, test_idx = idx[:split_point], idx[split_point:]
+
+                for split_name, sidx in [("train", train_idx), ("test", test_idx)]:
+                    ds_result["splits"][split_name] = _ecg_split_stats(signals[sidx], labels[sidx], class_map, rng)
+            else:
+                for fname in files:
+                    if fname not in matrices:
+                        continue
+                    matrix = matrices[fname]
                     split_key = "train" if "train" in fname or "normal" in fname else "test"
                     if "abnormal" in fname:
                         split_key = "test"
@@ -488,108 +889,11 @@ def _precompute_ecg():
                         split_key = "train"
                     if "test" in fname:
                         split_key = "test"
-                    dfs[split_key] = df
-
-            ds_result = {"class_names": class_map, "splits": {}}
-
-            for split_name, df in dfs.items():
-                labels = df.iloc[:, -1].values
-                labels = np.round(labels).astype(int)
-                signals = df.iloc[:, :-1].values
-
-                split_data = {
-                    "class_distribution": {},
-                    "mean_waveforms": {},
-                    "std_waveforms": {},
-                    "samples": {},
-                    "features": {},
-                }
-
-                for class_id in sorted(set(labels)):
-                    class_name = class_map.get(class_id, f"Class {class_id}")
-                    mask = labels == class_id
-                    class_signals = signals[mask]
-
-                    split_data["class_distribution"][class_name] = int(mask.sum())
-
-                    mean_wf = np.mean(class_signals, axis=0).tolist()
-                    std_wf = np.std(class_signals, axis=0).tolist()
-                    split_data["mean_waveforms"][class_name] = mean_wf
-                    split_data["std_waveforms"][class_name] = std_wf
-
-                    # Sample 50 waveforms per class
-                    n_samples = min(50, len(class_signals))
-                    idx = np.random.RandomState(42).choice(len(class_signals), n_samples, replace=False)
-                    split_data["samples"][class_name] = class_signals[idx].tolist()
-
-                    # Signal features
-                    split_data["features"][class_name] = {
-                        "peak_amplitude": float(np.mean(np.max(class_signals, axis=1))),
-                        "energy": float(np.mean(np.sum(class_signals**2, axis=1))),
-                        "zero_crossings": float(
-                            np.mean(np.sum(np.diff(np.sign(class_signals - 0.5), axis=1) != 0, axis=1))
-                        ),
-                    }
-
-                ds_result["splits"][split_name] = split_data
-
-            # For PTB, combine normal and abnormal into train/test splits
-            if dataset_name == "ptbdb":
-                normal_path = os.path.join(ECG_DIR, "ptbdb_normal.csv")
-                abnormal_path = os.path.join(ECG_DIR, "ptbdb_abnormal.csv")
-
-                # Try full dataset first, fall back to sample if not available
-                if not os.path.exists(normal_path):
-                    normal_path = os.path.join(ECG_DIR, "ptbdb_normal_sample.csv")
-                if not os.path.exists(abnormal_path):
-                    abnormal_path = os.path.join(ECG_DIR, "ptbdb_abnormal_sample.csv")
-
-                if os.path.exists(normal_path) and os.path.exists(abnormal_path):
-                    df_normal = pd.read_csv(normal_path, header=None)
-                    df_abnormal = pd.read_csv(abnormal_path, header=None)
-
-                    # Label: normal=0, abnormal=1
-                    df_normal.iloc[:, -1] = 0
-                    df_abnormal.iloc[:, -1] = 1
-                    df_all = pd.concat([df_normal, df_abnormal], ignore_index=True)
-
-                    labels = df_all.iloc[:, -1].values.astype(int)
-                    signals = df_all.iloc[:, :-1].values
-
-                    # 80/20 split
-                    rng = np.random.RandomState(42)
-                    idx = rng.permutation(len(labels))
-                    split_point = int(0.8 * len(idx))
-                    train_idx, test_idx = idx[:split_point], idx[split_point:]
-
-                    for split_name, sidx in [("train", train_idx), ("test", test_idx)]:
-                        split_labels = labels[sidx]
-                        split_signals = signals[sidx]
-                        split_data = {
-                            "class_distribution": {},
-                            "mean_waveforms": {},
-                            "std_waveforms": {},
-                            "samples": {},
-                            "features": {},
-                        }
-                        for class_id in sorted(set(split_labels)):
-                            class_name = class_map.get(class_id, f"Class {class_id}")
-                            mask = split_labels == class_id
-                            class_signals = split_signals[mask]
-                            split_data["class_distribution"][class_name] = int(mask.sum())
-                            split_data["mean_waveforms"][class_name] = np.mean(class_signals, axis=0).tolist()
-                            split_data["std_waveforms"][class_name] = np.std(class_signals, axis=0).tolist()
-                            n_samples = min(50, len(class_signals))
-                            sample_idx = rng.choice(len(class_signals), n_samples, replace=False)
-                            split_data["samples"][class_name] = class_signals[sample_idx].tolist()
-                            split_data["features"][class_name] = {
-                                "peak_amplitude": float(np.mean(np.max(class_signals, axis=1))),
-                                "energy": float(np.mean(np.sum(class_signals**2, axis=1))),
-                                "zero_crossings": float(
-                                    np.mean(np.sum(np.diff(np.sign(class_signals - 0.5), axis=1) != 0, axis=1))
-                                ),
-                            }
-                        ds_result["splits"][split_name] = split_data
+                    labels = np.round(matrix[:, -1]).astype(np.int8)
+                    signals = matrix[:, :-1]
+                    ds_result["splits"][split_key] = _ecg_split_stats(
+                        signals, labels, class_map, np.random.default_rng(42)
+                    )
 
             # Compute correlation matrix between mean waveforms (using train split)
             if "train" in ds_result["splits"]:
@@ -602,30 +906,19 @@ def _precompute_ecg():
             # PCA 2D embedding on sampled waveforms (train split)
             if "train" in ds_result["splits"]:
                 samples = ds_result["splits"]["train"]["samples"]
-                pca_signals = []
-                pca_labels = []
-                for class_name, class_samples in samples.items():
-                    for s in class_samples:
-                        pca_signals.append(s)
-                        pca_labels.append(class_name)
-                if len(pca_signals) > 2:
-                    from sklearn.decomposition import PCA
-
-                    pca_arr = np.array(pca_signals)
-                    pca = PCA(n_components=2, random_state=42)
-                    embedding = pca.fit_transform(pca_arr)
+                pca_labels = [name for name, class_samples in samples.items() for _ in range(len(class_samples))]
+                if len(pca_labels) > 2:
+                    embedding, explained_variance = _pca_2d(np.concatenate(list(samples.values())))
                     ds_result["pca_embedding"] = {
-                        "x": embedding[:, 0].tolist(),
-                        "y": embedding[:, 1].tolist(),
+                        "x": embedding[:, 0],
+                        "y": embedding[:, 1],
                         "labels": pca_labels,
-                        "explained_variance": pca.explained_variance_ratio_.tolist(),
+                        "explained_variance": explained_variance.tolist(),
                     }
 
             result[dataset_name] = ds_result
 
-        with open(ECG_CACHE, "w") as f:
-            json.dump(result, f)
-
+        _write_ecg_cache(result)
         return result
 
     except Exception:
@@ -649,10 +942,11 @@ def get_cache_info():
     ]
     info = []
     for ds in datasets:
-        entry = {"name": ds["name"], "in_memory": ds["key"] in _cache}
+        # Peek so the admin tab's polling doesn't reorder the LRU
+        cached = _cache.peek(ds["key"])
+        entry = {"name": ds["name"], "in_memory": cached is not None}
         # Memory cache row count
-        if ds["key"] in _cache:
-            cached = _cache[ds["key"]]
+        if cached is not None:
             if isinstance(cached, pd.DataFrame):
                 entry["memory_rows"] = len(cached)
             elif isinstance(cached, dict):
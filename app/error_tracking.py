@@ -15,6 +15,7 @@ Usage:
     capture_message("Unusual condition detected", level="warning")
 """
 
+import logging
 import os
 import sys
 
@@ -24,6 +25,19 @@ from app import metrics
 logger = get_logger(__name__)
 
 _sentry_initialized = False
+# Bound once by init_error_tracking() so the capture paths skip the import
+_sentry_capture_exception = None
+_sentry_capture_message = None
+
+# Sentry level names accepted by capture_message, mapped to stdlib logging levels
+_LEVEL_MAP = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "fatal": logging.CRITICAL,
+    "critical": logging.CRITICAL,
+}
 
 
 def init_error_tracking():
@@ -32,7 +46,7 @@ def init_error_tracking():
     If SENTRY_DSN is set, initializes the Sentry SDK.
     Otherwise, falls back to structured logging.
     """
-    global _sentry_initialized
+    global _sentry_initialized, _sentry_capture_exception, _sentry_capture_message
     dsn = os.environ.get("SENTRY_DSN", "")
 
     if dsn:
@@ -44,6 +58,8 @@ def init_error_tracking():
                 environment=os.environ.get("DASH_ENV", "development"),
                 traces_sample_rate=float(os.environ.get("SENTRY_TRACES_RATE", "0.1")),
             )
+            _sentry_capture_exception = sentry_sdk.capture_exception
+            _sentry_capture_message = sentry_sdk.capture_message
             _sentry_initialized = True
             logger.info("Sentry error tracking initialized")
         except ImportError:
@@ -55,30 +71,32 @@ def init_error_tracking():
 def capture_exception(exc_info=None):
     """Capture an exception for error tracking.
 
+    Does nothing (and does not count towards errors_total) when there is no
+    exception to report.
+
     Args:
         exc_info: Exception info tuple (type, value, traceback).
                   If None, uses sys.exc_info().
     """
     if exc_info is None:
         exc_info = sys.exc_info()
+    if exc_info[0] is None:
+        return
 
     metrics.increment("errors_total")
 
     if _sentry_initialized:
         try:
-            import sentry_sdk
-
-            sentry_sdk.capture_exception(exc_info[1] if exc_info[1] else None)
+            _sentry_capture_exception(exc_info[1])
         except Exception:
             logger.error("Failed to send exception to Sentry", exc_info=True)
     else:
-        if exc_info[0] is not None:
-            logger.error(
-                "Exception captured: %s: %s",
-                exc_info[0].__name__,
-                exc_info[1],
-                exc_info=exc_info,
-            )
+        logger.error(
+            "Exception captured: %s: %s",
+            exc_info[0].__name__,
+            exc_info[1],
+            exc_info=exc_info,
+        )
 
 
 def capture_message(message, level="info"):
@@ -90,11 +108,10 @@ def capture_message(message, level="info"):
     """
     if _sentry_initialized:
         try:
-            import sentry_sdk
-
-            sentry_sdk.capture_message(message, level=level)
+            _sentry_capture_message(message, level=level)
         except Exception:
             logger.error("Failed to send message to Sentry", exc_info=True)
     else:
-        log_fn = getattr(logger, level, logger.info)
-        log_fn("Error tracking message: %s", message)
+        log_level = _LEVEL_MAP.get(level, logging.INFO)
+        if logger.isEnabledFor(log_level):
+            logger.log(log_level, "Error tracking message: %s", message)
@@ -7,16 +7,79 @@ Returns JSON status of application, cache, and data availability.
 import os
 import time
 
-from flask import jsonify
-
-from app.config import CACHE_DIR, ECG_CACHE, EQUIPMENT_CACHE, BASES_CACHE, HEALTHCARE_CACHE
+from app.config import CACHE_DIR, DATASET_DIR, ECG_CACHE, EQUIPMENT_CACHE, BASES_CACHE, HEALTHCARE_CACHE
 from app.logging_config import get_logger
+from app.metrics import json_response
 
 logger = get_logger(__name__)
 
 # Track application start time
 _start_time = time.time()
 
+# Probe results are reused for this long so frequent load-balancer polls don't hit the filesystem
+_PROBE_TTL_SECONDS = 1.0
+_cache = (0.0, None)
+
+# The datasets directory is mounted at deploy time and practically never changes, so it is re-checked less often
+_DATASETS_TTL_SECONDS = 30.0
+_datasets_probe = (0.0, None)
+
+_CACHE_FILES = {
+    "equipment": EQUIPMENT_CACHE,
+    "bases": BASES_CACHE,
+    "healthcare": HEALTHCARE_CACHE,
+    "ecg": ECG_CACHE,
+}
+
+
+def _probe_filesystem():
+    """Collect cache file sizes with a single directory scan.
+
+    Returns:
+        Tuple of (cache_status dict, cache directory exists, datasets directory exists).
+    """
+    sizes = {}
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            for entry in it:
+                # A file removed or unreadable mid-scan is reported as missing, not as a probe failure
+                try:
+                    if entry.is_file():
+                        sizes[entry.name] = entry.stat().st_size
+                except OSError:
+                    continue
+        cache_dir_exists = True
+    except OSError:
+        cache_dir_exists = False
+
+    cache_status = {}
+    for name, path in _CACHE_FILES.items():
+        size = sizes.get(os.path.basename(path))
+        cache_status[name] = {"exists": size is not None, "size_bytes": size or 0}
+    return cache_status, cache_dir_exists, _datasets_available()
+
+
+def _datasets_available():
+    """Return whether DATASET_DIR exists, re-checked at most once per _DATASETS_TTL_SECONDS."""
+    global _datasets_probe
+    checked_at, available = _datasets_probe
+    now = time.monotonic()
+    if available is None or now - checked_at >= _DATASETS_TTL_SECONDS:
+        available = os.path.isdir(DATASET_DIR)
+        _datasets_probe = (now, available)
+    return available
+
+
+def _cached_probe():
+    """Return filesystem probe results, refreshed at most once per _PROBE_TTL_SECONDS."""
+    global _cache
+    checked_at, probe = _cache
+    now = time.monotonic()
+    if probe is None or now - checked_at >= _PROBE_TTL_SECONDS:
+        probe = _probe_filesystem()
+        _cache = (now, probe)
+    return probe
+
 
 def register_health_endpoint(server):
     """Register the /health endpoint on the Flask server.
@@ -28,24 +91,7 @@ def register_health_endpoint(server):
     @server.route("/health")
     def health_check():
         uptime_seconds = time.time() - _start_time
-
-        # Check cache status
-        cache_files = {
-            "equipment": EQUIPMENT_CACHE,
-            "bases": BASES_CACHE,
-            "healthcare": HEALTHCARE_CACHE,
-            "ecg": ECG_CACHE,
-        }
-        cache_status = {}
-        for name, path in cache_files.items():
-            cache_status[name] = {
-                "exists": os.path.exists(path),
-                "size_bytes": os.path.getsize(path) if os.path.exists(path) else 0,
-            }
-
-        # Check data directory
-        datasets_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "datasets")
-        data_available = os.path.isdir(datasets_dir)
+        cache_status, cache_dir_exists, data_available = _cached_probe()
 
         # Determine overall health
         all_caches_exist = all(s["exists"] for s in cache_status.values())
@@ -55,10 +101,10 @@ def register_health_endpoint(server):
             "status": status,
             "uptime_seconds": round(uptime_seconds, 1),
             "cache": cache_status,
-            "cache_directory": os.path.exists(CACHE_DIR),
+            "cache_directory": cache_dir_exists,
             "data_available": data_available,
             "all_caches_warm": all_caches_exist,
         }
 
         http_status = 200 if status == "healthy" else 503
-        return jsonify(response), http_status
+        return json_response(response, http_status)
@@ -5,29 +5,65 @@ Supports two output formats controlled by DASH_LOG_FORMAT env var:
   - "text"  : Human-readable pipe-delimited format (default in development)
 """
 
+import atexit
+import copy
 import json
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from app import APP_ROOT
+from app.settings import DASH_ENV, DASH_LOG_LEVEL, DASH_LOG_QUEUE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Log file path — next to the app directory
-LOG_FILE = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-    "app.log",
-)
+LOG_FILE = os.path.join(APP_ROOT, "app.log")
 
 # Max log file size: 10 MB, keep 5 backups
 LOG_MAX_BYTES = 10 * 1024 * 1024
 LOG_BACKUP_COUNT = 5
 
 
+# DASH_LOG_LEVEL names accepted by setup_logging; anything else falls back to DEBUG
+_LEVEL_NAMES = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.CRITICAL,
+}
+
+# Optional fields that callers attach to records via ``extra=``
+_EXTRA_KEYS = ("request_id", "duration_ms", "status_code", "endpoint", "component")
+
+
+def _dumps(log_entry):
+    """Serialize a log entry with orjson when installed, else the stdlib json module."""
+    if orjson is not None:
+        return orjson.dumps(log_entry, default=str).decode()
+    return json.dumps(log_entry, default=str)
+
+
 class JSONFormatter(logging.Formatter):
-    """Format log records as single-line JSON for ELK/Splunk ingestion."""
+    """Format log records as single-line JSON for ELK/Splunk ingestion.
+
+    Timestamps are UTC with millisecond precision. orjson is used for
+    serialization when it is installed.
+    """
 
     def format(self, record):
+        timestamp = datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds")
         log_entry = {
-            "timestamp": self.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S.") + f"{record.msecs:03.0f}Z",
+            "timestamp": timestamp[:-6] + "Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -40,12 +76,13 @@ class JSONFormatter(logging.Formatter):
             log_entry["exception"] = self.formatException(record.exc_info)
 
         # Include any extra fields attached to the record
-        for key in ("request_id", "duration_ms", "status_code", "endpoint", "component"):
-            value = getattr(record, key, None)
+        fields = record.__dict__
+        for key in _EXTRA_KEYS:
+            value = fields.get(key)
             if value is not None:
                 log_entry[key] = value
 
-        return json.dumps(log_entry, default=str)
+        return _dumps(log_entry)
 
 
 class TextFormatter(logging.Formatter):
@@ -58,7 +95,64 @@ class TextFormatter(logging.Formatter):
         )
 
 
-def setup_logging(level=None, log_format=None):
+class _RecordQueueHandler(QueueHandler):
+    """Enqueue a copy of each record with its message already merged.
+
+    The message is resolved on the calling thread, so logged objects are
+    stringified by the thread that owns them and before they can change.
+    Unlike the stock QueueHandler, exc_info is kept and the record is not
+    pre-formatted, so the listener's formatters still render tracebacks
+    into the JSON output.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _BytesRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that formats each record once and writes UTF-8 bytes.
+
+    The stock handler formats every record twice (once in shouldRollover to
+    size it, once in emit) and writes through a TextIOWrapper. Here the line
+    is encoded once and its byte length drives the rollover check.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, "ab")
+
+    def emit(self, record):
+        try:
+            data = (self.format(record) + self.terminator).encode("utf-8")
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+                self.doRollover()
+            self.stream.write(data)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+_queue_listener = None
+
+
+def _stop_queue_listener():
+    """Flush and stop the background log listener, if one is running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+def setup_logging(level=None, log_format=None, use_queue=None):
     """Configure application-wide logging.
 
     Args:
@@ -67,18 +161,17 @@ def setup_logging(level=None, log_format=None):
                WARNING in production.
         log_format: "json" or "text". If None, reads from DASH_LOG_FORMAT
                     env var (defaults to "json" in production, "text" in dev).
+        use_queue: Route records through a QueueHandler to a background
+                   QueueListener that owns the console and file handlers.
+                   If None, reads DASH_LOG_QUEUE (on outside development).
 
     Returns:
         The root application logger ('app').
     """
     if level is None:
-        from app.settings import DASH_LOG_LEVEL
-
-        level = getattr(logging, DASH_LOG_LEVEL.upper(), logging.DEBUG)
+        level = _LEVEL_NAMES.get(DASH_LOG_LEVEL.upper(), logging.DEBUG)
 
     if log_format is None:
-        from app.settings import DASH_ENV
-
         log_format = os.environ.get("DASH_LOG_FORMAT", "json" if DASH_ENV == "production" else "text")
 
     # Select formatter
@@ -93,22 +186,33 @@ def setup_logging(level=None, log_format=None):
     console_handler.setFormatter(formatter)
 
     # File handler with rotation
-    file_handler = RotatingFileHandler(
+    file_handler = _BytesRotatingFileHandler(
         LOG_FILE,
         mode="a",
         maxBytes=LOG_MAX_BYTES,
         backupCount=LOG_BACKUP_COUNT,
-        encoding="utf-8",
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
 
+    if use_queue is None:
+        use_queue = DASH_LOG_QUEUE
+
+    handlers = [console_handler, file_handler]
+    _stop_queue_listener()
+    if use_queue:
+        global _queue_listener
+        log_queue = queue.SimpleQueue()
+        _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        handlers = [_RecordQueueHandler(log_queue)]
+
     # Configure the application root logger
     logger = logging.getLogger("app")
     logger.setLevel(logging.DEBUG)
     logger.handlers.clear()
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    for handler in handlers:
+        logger.addHandler(handler)
 
     # Suppress noisy third-party loggers
     logging.getLogger("werkzeug").setLevel(logging.WARNING)
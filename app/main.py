@@ -1,11 +1,14 @@
 """Data Visualization App - Main entry point."""
 
+import functools
 import sys
 import os
 from urllib.parse import parse_qs
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Running as a script (python app/main.py) puts app/ on sys.path rather than the repo root,
+# so add the root for the "app." imports; gunicorn and tests import app.main normally
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import dash  # noqa: E402
 from dash import dcc, html, Input, Output, no_update  # noqa: E402
@@ -39,6 +42,25 @@ from app.metrics import register_metrics_endpoint  # noqa: E402
 register_health_endpoint(server)
 register_metrics_endpoint(server)
 
+# gunicorn imports app.main in each worker and never runs the __main__ block below, so
+# configure logging (and start the DASH_LOG_QUEUE listener) here outside development
+from app.settings import DASH_ENV  # noqa: E402
+
+if __name__ != "__main__" and DASH_ENV != "development":
+    from app.logging_config import setup_logging
+
+    setup_logging()
+
+# Preload datasets off the request path; early requests wait on the per-dataset load locks
+from app.settings import DASH_WARM_CACHES  # noqa: E402
+
+if DASH_WARM_CACHES:
+    import threading
+
+    from app.data.loader import warm_caches
+
+    threading.Thread(target=warm_caches, name="cache-warm", daemon=True).start()
+
 # App layout
 app.layout = html.Div(
     [
@@ -135,16 +157,22 @@ app.layout = html.Div(
 )
 
 
-VALID_TABS = {
-    "tab-instructions",
-    "tab-equipment",
-    "tab-ecg",
-    "tab-bases",
-    "tab-healthcare",
-    "tab-combined",
-    "tab-admin",
+# Tab id -> layout builder; also the source of truth for which ?tab= values are accepted.
+# Tabs whose layout doesn't read any data are built once and reused; the equipment, bases
+# and healthcare layouts fill filter options from the loaded datasets, so they are rebuilt.
+# The admin tab prebuilds its own layout at import
+_TAB_DISPATCH = {
+    "tab-instructions": functools.cache(tab_instructions.layout),
+    "tab-equipment": tab_equipment.layout,
+    "tab-ecg": functools.cache(tab_ecg.layout),
+    "tab-bases": tab_bases.layout,
+    "tab-healthcare": tab_healthcare.layout,
+    "tab-combined": functools.cache(tab_combined.layout),
+    "tab-admin": tab_admin.layout,
 }
 
+VALID_TABS = frozenset(_TAB_DISPATCH)
+
 
 @app.callback(
     Output("main-tabs", "active_tab"),
@@ -152,6 +180,11 @@ VALID_TABS = {
 )
 def set_tab_from_url(search):
     """Set active tab from URL query parameter on page load."""
+    # Fast path for the canonical "?tab=<id>" written by the URL sync callback
+    if search and search.startswith("?tab="):
+        tab = search[5:]
+        if tab in VALID_TABS:
+            return tab
     if search:
         params = parse_qs(search.lstrip("?"))
         tab = params.get("tab", [None])[0]
@@ -184,20 +217,9 @@ app.clientside_callback(
 )
 def render_tab(active_tab):
     """Render the selected tab content."""
-    if active_tab == "tab-instructions":
-        return tab_instructions.layout()
-    elif active_tab == "tab-equipment":
-        return tab_equipment.layout()
-    elif active_tab == "tab-ecg":
-        return tab_ecg.layout()
-    elif active_tab == "tab-bases":
-        return tab_bases.layout()
-    elif active_tab == "tab-healthcare":
-        return tab_healthcare.layout()
-    elif active_tab == "tab-combined":
-        return tab_combined.layout()
-    elif active_tab == "tab-admin":
-        return tab_admin.layout()
+    handler = _TAB_DISPATCH.get(active_tab)
+    if handler is not None:
+        return handler()
     return html.Div("Select a tab to get started.")
 
 
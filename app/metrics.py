@@ -5,13 +5,18 @@ the /metrics endpoint as JSON for scraping by Prometheus (via json_exporter),
 Datadog, or custom monitoring.
 """
 
+import functools
+import json
 import threading
 import time
 
-from flask import jsonify
-
 from app.logging_config import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
 _lock = threading.Lock()
@@ -20,6 +25,9 @@ _lock = threading.Lock()
 _counters = {}
 _histograms = {}
 
+# Histogram slots: each _histograms value is a [count, sum, min, max] list
+_COUNT, _SUM, _MIN, _MAX = 0, 1, 2, 3
+
 
 def increment(name, value=1, labels=None):
     """Increment a counter metric.
@@ -42,15 +50,21 @@ def observe(name, duration, labels=None):
         duration: Duration in seconds.
         labels: Optional dict of label key-value pairs.
     """
-    key = _make_key(name, labels)
+    _observe_key(_make_key(name, labels), duration)
+
+
+def _observe_key(key, duration):
+    """Add one observation to the histogram stored under an already-built key."""
     with _lock:
-        if key not in _histograms:
-            _histograms[key] = {"count": 0, "sum": 0.0, "min": float("inf"), "max": 0.0}
-        h = _histograms[key]
-        h["count"] += 1
-        h["sum"] += duration
-        h["min"] = min(h["min"], duration)
-        h["max"] = max(h["max"], duration)
+        h = _histograms.get(key)
+        if h is None:
+            h = _histograms[key] = [0, 0.0, float("inf"), 0.0]
+        h[_COUNT] += 1
+        h[_SUM] += duration
+        if duration < h[_MIN]:
+            h[_MIN] = duration
+        if duration > h[_MAX]:
+            h[_MAX] = duration
 
 
 def timer(name, labels=None):
@@ -64,9 +78,11 @@ def timer(name, labels=None):
 
 
 class _Timer:
+    __slots__ = ("_key", "_start")
+
     def __init__(self, name, labels):
-        self._name = name
-        self._labels = labels
+        # Resolve the key up front so __exit__ only does the clock read and histogram update
+        self._key = _make_key(name, labels)
         self._start = None
 
     def __enter__(self):
@@ -74,30 +90,29 @@ class _Timer:
         return self
 
     def __exit__(self, *args):
-        duration = time.perf_counter() - self._start
-        observe(self._name, duration, self._labels)
+        _observe_key(self._key, time.perf_counter() - self._start)
 
 
 def get_metrics():
     """Return a snapshot of all collected metrics."""
+    # Copy under the lock, then format with it released so scrapes don't stall increments
     with _lock:
-        counters_out = {}
-        for key, value in _counters.items():
-            counters_out[key] = value
+        counters = _counters.copy()
+        histograms = [(key, tuple(hist)) for key, hist in _histograms.items()]
+
+    counters_out = {_format_key(key): value for key, value in counters.items()}
 
-        histograms_out = {}
-        for key, hist in _histograms.items():
-            h = dict(hist)
-            if h["count"] > 0:
-                h["avg"] = round(h["sum"] / h["count"], 6)
-            else:
-                h["avg"] = 0.0
-            h["sum"] = round(h["sum"], 6)
-            h["min"] = round(h["min"], 6) if h["min"] != float("inf") else 0.0
-            h["max"] = round(h["max"], 6)
-            histograms_out[key] = h
+    histograms_out = {}
+    for key, (count, total, low, high) in histograms:
+        histograms_out[_format_key(key)] = {
+            "count": count,
+            "sum": total,
+            "min": low if low != float("inf") else 0.0,
+            "max": high,
+            "avg": total / count if count > 0 else 0.0,
+        }
 
-        return {"counters": counters_out, "histograms": histograms_out}
+    return {"counters": counters_out, "histograms": histograms_out}
 
 
 def reset():
@@ -108,13 +123,48 @@ def reset():
 
 
 def _make_key(name, labels):
-    """Build a metric key from name and labels."""
+    """Build a metric key from name and labels.
+
+    Unlabeled metrics are keyed by name; labeled ones by a (name, sorted label items)
+    tuple that is only rendered to a string on export (see _format_key).
+    """
     if not labels:
         return name
-    label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+    return _compose_key(name, frozenset(labels.items()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _compose_key(name, label_items):
+    """Build the tuple key for a label set; cached since the same label sets recur on every call."""
+    return name, tuple(sorted(label_items))
+
+
+def _format_key(key):
+    """Render a metric key as "name" or "name{k=v,...}"."""
+    if isinstance(key, str):
+        return key
+    name, label_items = key
+    label_str = ",".join(f"{k}={v}" for k, v in label_items)
     return f"{name}{{{label_str}}}"
 
 
+def json_response(payload, status=200):
+    """Build a JSON Flask response, encoded with orjson when it is installed.
+
+    Args:
+        payload: JSON-serializable dict.
+        status: HTTP status code.
+    """
+    # Imported here so the data loader can record metrics without pulling in Flask
+    from flask import Response
+
+    if orjson is not None:
+        body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        body = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return Response(body, status=status, mimetype="application/json")
+
+
 def register_metrics_endpoint(server):
     """Register the /metrics endpoint on the Flask server.
 
@@ -124,4 +174,4 @@ def register_metrics_endpoint(server):
 
     @server.route("/metrics")
     def metrics_endpoint():
-        return jsonify(get_metrics())
+        return json_response(get_metrics())
@@ -5,12 +5,19 @@ Supports .env files via manual loading (no extra dependencies required).
 """
 
 import os
+import stat
+
+from app import APP_ROOT
 
 # ---------------------------------------------------------------------------
 # .env file loading (lightweight, no dependency on python-dotenv)
 # ---------------------------------------------------------------------------
 
-_ENV_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env")
+_ENV_FILE = os.path.join(APP_ROOT, ".env")
+
+
+# (path, mtime_ns) of .env files already applied, so repeat calls skip an unchanged file
+_loaded_env_files = set()
 
 
 def _load_dotenv(path=_ENV_FILE):
@@ -19,18 +26,27 @@ def _load_dotenv(path=_ENV_FILE):
     Skips blank lines, comments (#), and lines without '='.
     Does NOT override variables already set in the environment.
     """
-    if not os.path.isfile(path):
+    try:
+        st = os.stat(path)
+    except OSError:
         return
-    with open(path, encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.strip().strip("'\"")
-            if key and key not in os.environ:
-                os.environ[key] = value
+    if not stat.S_ISREG(st.st_mode):
+        return
+    stamp = (path, st.st_mtime_ns)
+    if stamp in _loaded_env_files:
+        return
+    with open(path, "rb") as fh:
+        data = fh.read()
+    for line in data.decode("utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        key = key.strip()
+        value = value.strip().strip("'\"")
+        if key and key not in os.environ:
+            os.environ[key] = value
+    _loaded_env_files.add(stamp)
 
 
 _load_dotenv()
@@ -49,6 +65,13 @@ DASH_DEBUG = os.environ.get("DASH_DEBUG", str(DASH_ENV == "development")).lower(
 # Logging
 DASH_LOG_LEVEL = os.environ.get("DASH_LOG_LEVEL", "DEBUG" if DASH_ENV == "development" else "WARNING")
 DASH_LOG_FORMAT = os.environ.get("DASH_LOG_FORMAT", "text" if DASH_ENV == "development" else "json")
+# Hand log records to a background thread so request threads never block on log I/O
+DASH_LOG_QUEUE = os.environ.get("DASH_LOG_QUEUE", str(DASH_ENV != "development")).lower() in ("true", "1", "yes")
+
+# Data caches: load the tabular datasets in the background at startup
+DASH_WARM_CACHES = os.environ.get("DASH_WARM_CACHES", str(DASH_ENV != "development")).lower() in ("true", "1", "yes")
+# Upper bound on in-memory DataFrame caches in MB; 0 keeps every dataset loaded
+DASH_CACHE_MAX_MB = int(os.environ.get("DASH_CACHE_MAX_MB", "0"))
 
 # Gunicorn (used in production via gunicorn.conf.py or CLI)
 GUNICORN_WORKERS = int(os.environ.get("GUNICORN_WORKERS", "4"))
@@ -2,6 +2,7 @@
 
 import os
 import platform
+import time
 from datetime import datetime
 
 import dash_bootstrap_components as dbc
@@ -14,90 +15,261 @@ from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Rendered disk-cache listing as (monotonic time, CACHE_DIR mtime_ns, component)
+_DISK_CACHE_TTL_SECONDS = 5.0
+_disk_cache = (0.0, None, None)
+
+# One Process handle for the app's lifetime: cpu_percent(interval=None) measures since the
+# previous call on the same object, so a fresh handle per refresh would always report 0.0
+_PROCESS = psutil.Process(os.getpid())
+# Latest system sample as (monotonic time, (rss bytes, system memory %, cpu %))
+_SYSTEM_SAMPLE_MIN_INTERVAL = 2.0
+_system_sample = (0.0, None)
+
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_BYTE_SCALES = tuple(1 << (10 * i) for i in range(len(_BYTE_UNITS)))
+
 
 def _format_bytes(nbytes):
     """Format bytes into human-readable string."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if nbytes < 1024:
-            return f"{nbytes:.1f} {unit}"
-        nbytes /= 1024
-    return f"{nbytes:.1f} TB"
+    # Each unit step is 10 bits, so the bit length picks the unit without a division loop
+    idx = min(max(int(nbytes).bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+    return f"{nbytes / _BYTE_SCALES[idx]:.1f} {_BYTE_UNITS[idx]}"
 
 
-def layout():
-    """Build the Admin Dashboard tab layout."""
+def _scan_disk_cache():
+    """List the files in CACHE_DIR with one scandir pass, sorted by name.
+
+    Returns:
+        List of dicts with name, size (bytes), modified (formatted) and ext keys.
+    """
+    entries = []
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                # A file removed or unreadable mid-scan is left out of the listing
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        entries.append((entry.name, entry.stat(follow_symlinks=False)))
+                except OSError:
+                    continue
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda item: item[0])
+
+    return [
+        {
+            "name": name,
+            "size": st.st_size,
+            "modified": datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M"),
+            "ext": os.path.splitext(name)[1].lstrip("."),
+        }
+        for name, st in entries
+    ]
+
+
+def _sample_system():
+    """Return (process RSS, system memory percent, process CPU percent).
+
+    Readings younger than _SYSTEM_SAMPLE_MIN_INTERVAL are reused instead of hitting psutil again.
+    """
+    global _system_sample
+    sampled_at, sample = _system_sample
+    now = time.monotonic()
+    if sample is None or now - sampled_at >= _SYSTEM_SAMPLE_MIN_INTERVAL:
+        sample = (
+            _PROCESS.memory_info().rss,
+            psutil.virtual_memory().percent,
+            _PROCESS.cpu_percent(interval=None),
+        )
+        _system_sample = (now, sample)
+    return sample
+
+
+_FILE_ICON = html.I(className="bi bi-file-earmark-binary me-2")
+
+
+def _build_disk_row(item, total_size):
+    """Build one file row of the disk-cache listing, with its share of total_size as a bar."""
+    pct = (item["size"] / total_size * 100) if total_size > 0 else 0
     return html.Div(
         [
-            # Auto-refresh interval (every 10s)
-            dcc.Interval(id="admin-refresh-interval", interval=10_000, n_intervals=0),
-            # --- System Info ---
-            html.Div(
-                [
-                    html.Div(
-                        [html.I(className="bi bi-cpu"), html.Span("System Information")],
-                        className="admin-section-title",
-                    ),
-                    dbc.Row(id="admin-system-metrics"),
-                ],
-                className="admin-section",
-            ),
-            # --- Cache Management ---
-            html.Div(
+            _FILE_ICON,
+            html.Span(item["name"], className="disk-file-name"),
+            dbc.Badge(item["ext"].upper(), color="info", className="me-2"),
+            html.Span(_format_bytes(item["size"]), className="disk-file-size"),
+            html.Div(html.Div(style={"width": f"{pct:.1f}%"}, className="disk-bar-fill"), className="disk-bar"),
+            html.Small(item["modified"], className="text-muted"),
+        ],
+        className="disk-file-row",
+    )
+
+
+def _render_disk_table(disk_items):
+    """Build the disk-cache file listing from _scan_disk_cache() output."""
+    if disk_items:
+        total_size = sum(item["size"] for item in disk_items)
+        file_cards = [_build_disk_row(item, total_size) for item in disk_items]
+        disk_table = html.Div(
+            [
+                html.Div(file_cards),
+                html.Div(
+                    [
+                        html.Span("Total cache size", className="text-muted"),
+                        html.Span(
+                            _format_bytes(total_size),
+                            className="disk-total-value",
+                        ),
+                    ],
+                    className="disk-total-row",
+                ),
+            ]
+        )
+    else:
+        disk_table = html.P("No cache files found.", className="text-muted")
+    return disk_table
+
+
+def _cached_disk_table():
+    """Return the rendered disk-cache listing, rebuilt only when CACHE_DIR may have changed.
+
+    The listing is reused while the directory's mtime (bumped when files are added,
+    removed or renamed) is unchanged, for at most _DISK_CACHE_TTL_SECONDS so in-place
+    rewrites of an existing cache file still show up.
+    """
+    global _disk_cache
+    try:
+        dir_mtime = os.stat(CACHE_DIR).st_mtime_ns
+    except FileNotFoundError:
+        dir_mtime = None
+    checked_at, cached_mtime, disk_table = _disk_cache
+    now = time.monotonic()
+    if disk_table is None or dir_mtime != cached_mtime or now - checked_at >= _DISK_CACHE_TTL_SECONDS:
+        disk_table = _render_disk_table(_scan_disk_cache())
+        _disk_cache = (now, dir_mtime, disk_table)
+    return disk_table
+
+
+# Status badges shared by every dataset card; Dash serializes shared component instances fine
+_BADGE_IN_MEMORY = dbc.Badge("In Memory", color="success", className="me-1")
+_BADGE_NOT_LOADED = dbc.Badge("Not Loaded", color="secondary", className="me-1")
+_BADGE_CACHED = dbc.Badge("Cached", color="info", className="me-1")
+_BADGE_NO_CACHE = dbc.Badge("No Cache", color="warning", className="me-1")
+_BADGE_SOURCE_OK = dbc.Badge("Source OK", color="success")
+_BADGE_SOURCE_MISSING = dbc.Badge("Missing", color="danger")
+_CARD_TITLE_STYLE = {"borderBottom": "none", "marginBottom": "8px"}
+_MUTED_BLOCK = "text-muted d-block"
+
+
+def _build_cache_card(ds):
+    """Build the status card for one entry of get_cache_info()."""
+    badges = [
+        _BADGE_IN_MEMORY if ds["in_memory"] else _BADGE_NOT_LOADED,
+        _BADGE_CACHED if ds["cache_exists"] else _BADGE_NO_CACHE,
+        _BADGE_SOURCE_OK if ds["source_exists"] else _BADGE_SOURCE_MISSING,
+    ]
+    rows = ds["memory_rows"]
+    return dbc.Col(
+        dbc.Card(
+            dbc.CardBody(
                 [
+                    html.H5(ds["name"], className="chart-title", style=_CARD_TITLE_STYLE),
+                    html.Div(badges, className="mb-2"),
                     html.Div(
-                        [html.I(className="bi bi-database-gear"), html.Span("Cache Management")],
-                        className="admin-section-title",
-                    ),
-                    dbc.Row(
                         [
-                            dbc.Col(
-                                html.Button(
-                                    [
-                                        html.I(
-                                            className="bi bi-arrow-clockwise me-2",
-                                            **{"aria-hidden": "true"},
-                                        ),
-                                        "Refresh All Caches",
-                                    ],
-                                    id="admin-refresh-all-btn",
-                                    className="btn btn-outline-warning btn-sm",
-                                    **{"aria-label": "Clear all in-memory caches and reload"},
-                                ),
-                                width="auto",
-                            ),
-                        ],
-                        className="mb-3",
+                            html.Small(f"Cache: {ds['cache_size_mb']} MB", className=_MUTED_BLOCK),
+                            html.Small(f"Last cached: {ds['cache_modified'] or 'Never'}", className=_MUTED_BLOCK),
+                            html.Small(f"Source: {ds['source_modified'] or 'N/A'}", className=_MUTED_BLOCK),
+                            html.Small(f"Rows: {rows}", className=_MUTED_BLOCK) if rows is not None else None,
+                        ]
                     ),
-                    html.Div(id="admin-refresh-status"),
-                    dbc.Row(id="admin-cache-cards"),
-                ],
-                className="admin-section",
+                ]
             ),
-            # --- Disk Cache ---
-            html.Div(
-                [
-                    html.Div(
-                        [html.I(className="bi bi-hdd"), html.Span("Disk Cache Files")],
-                        className="admin-section-title",
-                    ),
-                    html.Div(id="admin-disk-info"),
-                ],
-                className="admin-section",
-            ),
-        ],
-        className="tab-content-wrapper",
+            className="chart-card",
+        ),
+        md=3,
     )
 
 
+# The admin layout has no data-dependent parts, so the tree is built once at import
+_LAYOUT = html.Div(
+    [
+        # Auto-refresh interval (every 10s)
+        dcc.Interval(id="admin-refresh-interval", interval=10_000, n_intervals=0),
+        # --- System Info ---
+        html.Div(
+            [
+                html.Div(
+                    [html.I(className="bi bi-cpu"), html.Span("System Information")],
+                    className="admin-section-title",
+                ),
+                dbc.Row(id="admin-system-metrics"),
+            ],
+            className="admin-section",
+        ),
+        # --- Cache Management ---
+        html.Div(
+            [
+                html.Div(
+                    [html.I(className="bi bi-database-gear"), html.Span("Cache Management")],
+                    className="admin-section-title",
+                ),
+                dbc.Row(
+                    [
+                        dbc.Col(
+                            html.Button(
+                                [
+                                    html.I(
+                                        className="bi bi-arrow-clockwise me-2",
+                                        **{"aria-hidden": "true"},
+                                    ),
+                                    "Refresh All Caches",
+                                ],
+                                id="admin-refresh-all-btn",
+                                className="btn btn-outline-warning btn-sm",
+                                **{"aria-label": "Clear all in-memory caches and reload"},
+                            ),
+                            width="auto",
+                        ),
+                    ],
+                    className="mb-3",
+                ),
+                html.Div(id="admin-refresh-status"),
+                dbc.Row(id="admin-cache-cards"),
+            ],
+            className="admin-section",
+        ),
+        # --- Disk Cache ---
+        html.Div(
+            [
+                html.Div(
+                    [html.I(className="bi bi-hdd"), html.Span("Disk Cache Files")],
+                    className="admin-section-title",
+                ),
+                html.Div(id="admin-disk-info"),
+            ],
+            className="admin-section",
+        ),
+    ],
+    className="tab-content-wrapper",
+)
+
+
+def layout():
+    """Return the Admin Dashboard tab layout."""
+    return _LAYOUT
+
+
 @callback(
     Output("admin-system-metrics", "children"),
     Input("admin-refresh-interval", "n_intervals"),
 )
 def update_system_metrics(_):
     """Show system resource usage as KPI-style cards."""
-    process = psutil.Process(os.getpid())
-    mem_info = process.memory_info()
-    cpu_pct = process.cpu_percent(interval=None)
+    rss, vm_pct, cpu_pct = _sample_system()
 
     cards = [
         dbc.Col(
@@ -105,7 +277,7 @@ def update_system_metrics(_):
                 dbc.CardBody(
                     [
                         html.H6("Process Memory", className="kpi-title"),
-                        html.H3(_format_bytes(mem_info.rss), className="kpi-value", style={"color": "#38BDF8"}),
+                        html.H3(_format_bytes(rss), className="kpi-value", style={"color": "#38BDF8"}),
                     ]
                 ),
                 className="kpi-card",
@@ -117,9 +289,7 @@ def update_system_metrics(_):
                 dbc.CardBody(
                     [
                         html.H6("System Memory", className="kpi-title"),
-                        html.H3(
-                            f"{psutil.virtual_memory().percent}%", className="kpi-value", style={"color": "#22D3EE"}
-                        ),
+                        html.H3(f"{vm_pct}%", className="kpi-value", style={"color": "#22D3EE"}),
                     ]
                 ),
                 className="kpi-card",
@@ -164,128 +334,10 @@ def update_cache_status(_, n_clicks):
     """Display cache status cards for each dataset."""
     cache_info = get_cache_info()
 
-    cards = []
-    for ds in cache_info:
-        mem_badge = (
-            dbc.Badge("In Memory", color="success", className="me-1")
-            if ds["in_memory"]
-            else dbc.Badge("Not Loaded", color="secondary", className="me-1")
-        )
-        cache_badge = (
-            dbc.Badge("Cached", color="info", className="me-1")
-            if ds["cache_exists"]
-            else dbc.Badge("No Cache", color="warning", className="me-1")
-        )
-        source_badge = (
-            dbc.Badge("Source OK", color="success") if ds["source_exists"] else dbc.Badge("Missing", color="danger")
-        )
-
-        rows_text = ""
-        if ds["memory_rows"] is not None:
-            rows_text = f"Rows: {ds['memory_rows']}"
-
-        card = dbc.Col(
-            dbc.Card(
-                dbc.CardBody(
-                    [
-                        html.H5(
-                            ds["name"], className="chart-title", style={"borderBottom": "none", "marginBottom": "8px"}
-                        ),
-                        html.Div([mem_badge, cache_badge, source_badge], className="mb-2"),
-                        html.Div(
-                            [
-                                html.Small(
-                                    f"Cache: {ds['cache_size_mb']} MB",
-                                    className="text-muted d-block",
-                                ),
-                                html.Small(
-                                    f"Last cached: {ds['cache_modified'] or 'Never'}",
-                                    className="text-muted d-block",
-                                ),
-                                html.Small(
-                                    f"Source: {ds['source_modified'] or 'N/A'}",
-                                    className="text-muted d-block",
-                                ),
-                                html.Small(rows_text, className="text-muted d-block") if rows_text else None,
-                            ]
-                        ),
-                    ]
-                ),
-                className="chart-card",
-            ),
-            md=3,
-        )
-        cards.append(card)
+    cards = [_build_cache_card(ds) for ds in cache_info]
 
     # Disk cache info — only show actual cache files (skip dotfiles)
-    disk_items = []
-    if os.path.exists(CACHE_DIR):
-        for f in sorted(os.listdir(CACHE_DIR)):
-            if f.startswith("."):
-                continue
-            fpath = os.path.join(CACHE_DIR, f)
-            if os.path.isfile(fpath):
-                sz = os.path.getsize(fpath)
-                mtime = datetime.fromtimestamp(os.path.getmtime(fpath)).strftime("%Y-%m-%d %H:%M")
-                ext = os.path.splitext(f)[1].lstrip(".")
-                disk_items.append({"name": f, "size": sz, "modified": mtime, "ext": ext})
-
-    if disk_items:
-        total_size = sum(item["size"] for item in disk_items)
-        file_cards = []
-        for item in disk_items:
-            pct = (item["size"] / total_size * 100) if total_size > 0 else 0
-            file_cards.append(
-                html.Div(
-                    [
-                        html.Div(
-                            [
-                                html.Div(
-                                    [
-                                        html.I(className="bi bi-file-earmark-binary me-2"),
-                                        html.Span(item["name"], className="disk-file-name"),
-                                    ],
-                                    className="disk-file-left",
-                                ),
-                                html.Div(
-                                    [
-                                        dbc.Badge(item["ext"].upper(), color="info", className="me-2"),
-                                        html.Span(_format_bytes(item["size"]), className="disk-file-size"),
-                                    ],
-                                    className="disk-file-right",
-                                ),
-                            ],
-                            className="disk-file-header",
-                        ),
-                        html.Div(
-                            html.Div(
-                                style={"width": f"{pct:.1f}%"},
-                                className="disk-bar-fill",
-                            ),
-                            className="disk-bar",
-                        ),
-                        html.Small(item["modified"], className="text-muted"),
-                    ],
-                    className="disk-file-row",
-                )
-            )
-        disk_table = html.Div(
-            [
-                html.Div(file_cards),
-                html.Div(
-                    [
-                        html.Span("Total cache size", className="text-muted"),
-                        html.Span(
-                            _format_bytes(total_size),
-                            className="disk-total-value",
-                        ),
-                    ],
-                    className="disk-total-row",
-                ),
-            ]
-        )
-    else:
-        disk_table = html.P("No cache files found.", className="text-muted")
+    disk_table = _cached_disk_table()
 
     return cards, disk_table
 
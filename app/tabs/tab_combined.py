@@ -16,10 +16,9 @@ from app.data.loader import load_equipment, load_bases
 from app.config import (
     PLOTLY_TEMPLATE,
     COLORS,
-    STATE_ABBREV_TO_NAME,
     STATE_NAME_TO_ABBREV,
-    CENSUS_REGIONS,
     REGION_COLORS,
+    state_lookup_vec,
 )
 from app.logging_config import get_logger
 
@@ -58,8 +57,9 @@ def _build_combined_data():
 
     # Join
     combined = pd.merge(equip_by_state, bases_by_state, on="state_abbrev", how="outer").fillna(0)
-    combined["state_name"] = combined["state_abbrev"].map(STATE_ABBREV_TO_NAME)
-    combined["region"] = combined["state_abbrev"].map(CENSUS_REGIONS).fillna("Other")
+    state_meta = state_lookup_vec(combined["state_abbrev"])
+    combined["state_name"] = state_meta["name"]
+    combined["region"] = state_meta["region"]
 
     return combined, branch_by_state, equip_df, bases_df
 
@@ -7,7 +7,7 @@ import plotly.express as px
 import numpy as np
 from scipy.signal import find_peaks
 
-from app.components.chart_container import chart_container
+from app.components.chart_container import chart_container, get_graph_config
 from app.data.loader import load_ecg_precomputed
 from app.config import PLOTLY_TEMPLATE, COLORS
 from app.logging_config import get_logger
@@ -515,7 +515,11 @@ def layout():
                                             className="mb-3 align-items-center",
                                         ),
                                         # Playback graph — taller to match fiducial panel
-                                        dcc.Graph(id="ecg-playback-graph", style={"height": "550px"}),
+                                        dcc.Graph(
+                                            id="ecg-playback-graph",
+                                            style={"height": "550px"},
+                                            config=get_graph_config("ecg-playback-graph"),
+                                        ),
                                     ]
                                 ),
                                 className="chart-card",
@@ -549,7 +553,11 @@ def layout():
                                             placement="right",
                                         ),
                                         dcc.Loading(
-                                            dcc.Graph(id="ecg-fiducial-graph", style={"height": "280px"}),
+                                            dcc.Graph(
+                                                id="ecg-fiducial-graph",
+                                                style={"height": "280px"},
+                                                config=get_graph_config("ecg-fiducial-graph"),
+                                            ),
                                             type="circle",
                                             color="#38BDF8",
                                         ),
@@ -663,7 +671,11 @@ def layout():
                                             className="mb-2",
                                         ),
                                         dcc.Loading(
-                                            dcc.Graph(id="ecg-waveform-browser", style={"height": "350px"}),
+                                            dcc.Graph(
+                                                id="ecg-waveform-browser",
+                                                style={"height": "350px"},
+                                                config=get_graph_config("ecg-waveform-browser"),
+                                            ),
                                             type="circle",
                                         ),
                                     ]
@@ -950,7 +962,7 @@ def update_waveform_browser(sample_idx, class_name, dataset):
     split = ds["splits"].get("train", list(ds["splits"].values())[0])
     samples = split["samples"].get(class_name, [])
 
-    if not samples:
+    if len(samples) == 0:
         return go.Figure(), "0 / 0"
 
     waveform = _prepare_beat(samples[sample_idx])
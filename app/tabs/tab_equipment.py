@@ -10,10 +10,10 @@ import plotly.graph_objects as go
 import pandas as pd
 
 from app.components.kpi_card import kpi_card
-from app.components.chart_container import chart_container
+from app.components.chart_container import chart_container, get_graph_config
 from app.logging_config import get_logger
 from app.data.loader import load_equipment
-from app.config import PLOTLY_TEMPLATE, COLORS, DEMIL_LABELS, STATE_POPULATION, CENSUS_REGIONS, REGION_COLORS
+from app.config import PLOTLY_TEMPLATE, COLORS, DEMIL_LABELS, CENSUS_REGIONS, REGION_COLORS, state_pop_vec
 
 logger = get_logger(__name__)
 
@@ -183,7 +183,12 @@ def layout():
                                             className="mb-2",
                                         ),
                                         dcc.Loading(
-                                            dcc.Graph(id="equip-choropleth", style={"height": "450px"}), type="circle"
+                                            dcc.Graph(
+                                                id="equip-choropleth",
+                                                style={"height": "450px"},
+                                                config=get_graph_config("equip-choropleth"),
+                                            ),
+                                            type="circle",
                                         ),
                                     ]
                                 ),
@@ -490,7 +495,7 @@ def update_equip_maps(store_data, map_metric):
     # --- Per-Capita Equipment Value — use pre-computed state_value_series ---
     pc = state_value_series.reset_index()
     pc.columns = ["State", "Total Value"]
-    pc["Population"] = pc["State"].map(STATE_POPULATION)
+    pc["Population"] = state_pop_vec(pc["State"])
     pc = pc.dropna(subset=["Population"])
     pc["Per Capita Value"] = pc["Total Value"] / pc["Population"]
 
@@ -7,6 +7,7 @@ for correct types and structure.
 
 import io
 import json
+import os
 import pytest
 import pandas as pd
 import plotly.graph_objects as go
@@ -549,3 +550,96 @@ class TestEcgUtilities:
         assert fiducials["S"] is None
         assert fiducials["P"] is None
         assert fiducials["T"] is None
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Admin Tab Helpers
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestAdminHelpers:
+    def test_scan_disk_cache_lists_files(self, tmp_path, monkeypatch):
+        from app.tabs import tab_admin
+
+        (tmp_path / "b.parquet").write_bytes(b"x" * 5)
+        (tmp_path / "a.feather").write_bytes(b"x" * 3)
+        (tmp_path / ".hidden").write_bytes(b"x")
+        (tmp_path / "subdir").mkdir()
+        monkeypatch.setattr(tab_admin, "CACHE_DIR", str(tmp_path))
+
+        items = tab_admin._scan_disk_cache()
+        assert [(i["name"], i["size"], i["ext"]) for i in items] == [
+            ("a.feather", 3, "feather"),
+            ("b.parquet", 5, "parquet"),
+        ]
+
+    def test_scan_disk_cache_missing_dir(self, tmp_path, monkeypatch):
+        from app.tabs import tab_admin
+
+        monkeypatch.setattr(tab_admin, "CACHE_DIR", str(tmp_path / "missing"))
+        assert tab_admin._scan_disk_cache() == []
+
+    def test_scan_disk_cache_skips_entry_that_vanishes(self, monkeypatch):
+        from app.tabs import tab_admin
+
+        class Entry:
+            def __init__(self, name, size=None):
+                self.name = name
+                self._size = size
+
+            def is_file(self, follow_symlinks=True):
+                return True
+
+            def stat(self, follow_symlinks=True):
+                if self._size is None:
+                    raise FileNotFoundError(self.name)
+                return os.stat_result((0, 0, 0, 0, 0, 0, self._size, 0, 0, 0))
+
+        class Scan:
+            def __enter__(self):
+                return iter([Entry("gone.parquet"), Entry("bases.feather", 7)])
+
+            def __exit__(self, *args):
+                return False
+
+        monkeypatch.setattr(tab_admin.os, "scandir", lambda path: Scan())
+        items = tab_admin._scan_disk_cache()
+        assert [(i["name"], i["size"]) for i in items] == [("bases.feather", 7)]
+
+    def test_scan_disk_cache_skips_symlinks(self, tmp_path, monkeypatch):
+        from app.tabs import tab_admin
+
+        (tmp_path / "a.feather").write_bytes(b"x" * 3)
+        (tmp_path / "link.feather").symlink_to(tmp_path / "a.feather")
+        monkeypatch.setattr(tab_admin, "CACHE_DIR", str(tmp_path))
+        assert [i["name"] for i in tab_admin._scan_disk_cache()] == ["a.feather"]
+
+    def test_disk_table_reused_until_dir_changes(self, tmp_path, monkeypatch):
+        from app.tabs import tab_admin
+
+        monkeypatch.setattr(tab_admin, "CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(tab_admin, "_disk_cache", (0.0, None, None))
+        first = tab_admin._cached_disk_table()
+        assert tab_admin._cached_disk_table() is first
+
+        (tmp_path / "new.parquet").write_bytes(b"x")
+        os.utime(tmp_path, ns=(0, 1))
+        assert tab_admin._cached_disk_table() is not first
+
+    def test_system_sample_is_throttled(self, monkeypatch):
+        from app.tabs import tab_admin
+
+        monkeypatch.setattr(tab_admin, "_system_sample", (0.0, None))
+        first = tab_admin._sample_system()
+        assert len(first) == 3
+        assert tab_admin._sample_system() is first
+
+    def test_format_bytes_unit_boundaries(self):
+        from app.tabs.tab_admin import _format_bytes
+
+        assert _format_bytes(0) == "0.0 B"
+        assert _format_bytes(1023) == "1023.0 B"
+        assert _format_bytes(1024) == "1.0 KB"
+        assert _format_bytes(1536 * 1024) == "1.5 MB"
+        assert _format_bytes(3 * 1024**3) == "3.0 GB"
+        assert _format_bytes(2048 * 1024**4) == "2048.0 TB"
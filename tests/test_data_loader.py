@@ -1,12 +1,24 @@
 """Comprehensive unit tests for app.data.loader module."""
 
 import json
+import os
 import pytest
+import numpy as np
 import pandas as pd
 from unittest.mock import patch, mock_open
 
 from app.data import loader
-from app.config import get_equipment_category
+from app.config import (
+    EQUIPMENT_CATEGORY_LABELS,
+    NSN_PREFIX_TO_CATEGORY,
+    STATE_POPULATION,
+    STATE_ABBREV_TO_NAME,
+    get_equipment_category,
+    get_equipment_category_codes,
+    get_equipment_category_vec,
+    state_lookup_vec,
+    state_pop_vec,
+)
 
 # ═══════════════════════════════════════════════════════════════════
 # Helper function tests
@@ -43,6 +55,55 @@ class TestGetEquipmentCategory:
     def test_empty_string_returns_other(self):
         assert get_equipment_category("") == "Other"
 
+    def test_unhashable_input_returns_other(self):
+        assert get_equipment_category(["10"]) == "Other"
+
+    def test_matches_vectorized_prefix_map(self):
+        nsns = pd.Series(["1005-01-001-0001", "2320-01-002-0002", "9999-01-000-0000", None])
+        mapped = nsns.str[:2].map(NSN_PREFIX_TO_CATEGORY).fillna("Other")
+        assert mapped.tolist() == [get_equipment_category(n) for n in nsns]
+
+    def test_vectorized_lookup_matches_scalar(self):
+        nsns = pd.Series(["1005-01-001-0001", "5820-01-004-0004", "9999-01-000-0000", "AB-12", "5", None])
+        result = get_equipment_category_vec(nsns)
+        assert list(result) == [get_equipment_category(n) for n in nsns]
+
+    def test_category_codes_round_trip_to_labels(self):
+        nsns = pd.Series(["1005-01-001-0001", "2320-01-002-0002", None])
+        codes = get_equipment_category_codes(nsns)
+        assert list(EQUIPMENT_CATEGORY_LABELS[codes]) == list(get_equipment_category_vec(nsns))
+
+
+class TestStatePopVec:
+    """Test the array-backed state population lookup."""
+
+    def test_matches_population_dict(self):
+        pops = state_pop_vec(pd.Series(["CA", "TX", "AS"]))
+        assert list(pops) == [STATE_POPULATION["CA"], STATE_POPULATION["TX"], STATE_POPULATION["AS"]]
+
+    def test_unknown_code_is_nan(self):
+        pops = state_pop_vec(pd.Series(["NY", "ZZ", None]))
+        assert pops[0] == STATE_POPULATION["NY"]
+        assert pd.isna(pops[1]) and pd.isna(pops[2])
+
+
+class TestStateLookupVec:
+    """Test the combined name/region/population state lookup."""
+
+    def test_gathers_all_columns(self):
+        codes = pd.Series(["CA", "PR"], index=[10, 20])
+        meta = state_lookup_vec(codes)
+        assert list(meta.index) == [10, 20]
+        assert list(meta["name"]) == [STATE_ABBREV_TO_NAME["CA"], STATE_ABBREV_TO_NAME["PR"]]
+        assert meta["region"].iloc[0] == "West"
+        assert meta["population"].iloc[0] == STATE_POPULATION["CA"]
+
+    def test_unknown_code(self):
+        meta = state_lookup_vec(pd.Series(["ZZ"]))
+        assert pd.isna(meta["name"].iloc[0])
+        assert meta["region"].iloc[0] == "Other"
+        assert pd.isna(meta["population"].iloc[0])
+
 
 class TestValidateDataframe:
     """Test the validate_dataframe() helper."""
@@ -73,6 +134,110 @@ class TestValidateDataframe:
             loader.validate_dataframe(42, ["a"], name="MyData")
 
 
+class TestStripRepeated:
+    """Test the per-distinct-value whitespace strip helper."""
+
+    def test_matches_str_strip(self):
+        s = pd.Series([" Army", "Navy ", " Army", None, "Navy"], index=[5, 6, 7, 8, 9], name="COMPONENT")
+        result = loader._strip_repeated(s)
+        pd.testing.assert_series_equal(result, s.str.strip())
+
+
+class TestDatasetCache:
+    """Test the byte-budgeted LRU dataset cache."""
+
+    def _frame(self, rows):
+        return pd.DataFrame({"value": np.zeros(rows, dtype=np.int64)})
+
+    def test_no_budget_keeps_everything(self):
+        cache = loader._DatasetCache()
+        cache["a"] = self._frame(1000)
+        cache["b"] = self._frame(1000)
+        assert list(cache) == ["a", "b"]
+
+    def test_evicts_least_recently_used(self):
+        cache = loader._DatasetCache(max_bytes=20_000)
+        cache["a"] = self._frame(1000)
+        cache["b"] = self._frame(1000)
+        cache["a"]  # touch "a" so "b" becomes the oldest entry
+        cache["c"] = self._frame(1000)
+        assert list(cache) == ["a", "c"]
+
+    def test_keeps_newest_entry_over_budget(self):
+        cache = loader._DatasetCache(max_bytes=1)
+        cache["a"] = self._frame(1000)
+        assert list(cache) == ["a"]
+
+    def test_non_dataframes_are_free(self):
+        cache = loader._DatasetCache(max_bytes=10_000)
+        cache["ecg"] = {"mitbih": {}}
+        cache["a"] = self._frame(1000)
+        assert list(cache) == ["ecg", "a"]
+
+    def test_peek_does_not_touch_recency(self):
+        cache = loader._DatasetCache(max_bytes=20_000)
+        cache["a"] = self._frame(1000)
+        cache["b"] = self._frame(1000)
+        assert cache.peek("a") is not None
+        assert cache.peek("missing") is None
+        cache["c"] = self._frame(1000)
+        assert list(cache) == ["b", "c"]
+
+    def test_get_touches_recency(self):
+        cache = loader._DatasetCache(max_bytes=20_000)
+        cache["a"] = self._frame(1000)
+        cache["b"] = self._frame(1000)
+        assert cache.get("a") is not None
+        assert cache.get("missing") is None
+        cache["c"] = self._frame(1000)
+        assert list(cache) == ["a", "c"]
+
+    def test_sizes_measured_once_per_insert(self):
+        cache = loader._DatasetCache(max_bytes=20_000)
+        with patch("app.data.loader._frame_nbytes", wraps=loader._frame_nbytes) as nbytes:
+            cache["a"] = self._frame(1000)
+            cache["b"] = self._frame(1000)
+            cache["c"] = self._frame(1000)
+        assert nbytes.call_count == 3
+
+    def test_size_bookkeeping_on_removal(self):
+        cache = loader._DatasetCache(max_bytes=20_000)
+        cache["a"] = self._frame(1000)
+        cache["b"] = self._frame(1000)
+        cache.pop("a")
+        del cache["b"]
+        assert cache._total == 0
+        cache["a"] = self._frame(1000)
+        cache.clear()
+        assert cache._total == 0 and cache._sizes == {}
+
+
+class TestCacheIsFresh:
+    """Test the cache-vs-source mtime check."""
+
+    def test_newer_cache_is_fresh(self, tmp_path):
+        source, cache = tmp_path / "src.csv", tmp_path / "cache.parquet"
+        source.write_text("a")
+        cache.write_text("b")
+        os.utime(source, (1000, 1000))
+        os.utime(cache, (2000, 2000))
+        assert loader._cache_is_fresh(str(cache), str(source))
+
+    def test_older_cache_is_stale(self, tmp_path):
+        source, cache = tmp_path / "src.csv", tmp_path / "cache.parquet"
+        source.write_text("a")
+        cache.write_text("b")
+        os.utime(source, (2000, 2000))
+        os.utime(cache, (1000, 1000))
+        assert not loader._cache_is_fresh(str(cache), str(source))
+
+    def test_missing_files_are_not_fresh(self, tmp_path):
+        existing = tmp_path / "src.csv"
+        existing.write_text("a")
+        assert not loader._cache_is_fresh(str(tmp_path / "missing"), str(existing))
+        assert not loader._cache_is_fresh(str(existing), str(tmp_path / "missing"))
+
+
 # ═══════════════════════════════════════════════════════════════════
 # load_equipment() tests
 # ═══════════════════════════════════════════════════════════════════
@@ -110,6 +275,9 @@ class TestLoadEquipment:
         assert "Year" in df.columns
         assert "Category" in df.columns
         assert df["Category"].iloc[0] == "Weapons & Firearms"
+        for column in ("Agency Name", "DEMIL Code", "Station Type"):
+            assert isinstance(df[column].dtype, pd.CategoricalDtype)
+        assert not {"UI", "DEMIL IC"} & set(mock_csv.call_args.kwargs["usecols"])
 
     @patch("app.data.loader._cache_is_fresh", return_value=False)
     @patch("app.data.loader.pd.read_csv")
@@ -218,6 +386,7 @@ class TestLoadBases:
         assert df["lon"].iloc[0] == pytest.approx(-85.65, abs=0.01)
         assert df["COMPONENT"].iloc[0] == "Army Active"  # stripped
         assert df["Oper Stat"].iloc[1] == "Unknown"  # fillna
+        assert "Geo Shape" not in mock_csv.call_args.kwargs["usecols"]
 
     @patch("app.data.loader._cache_is_fresh", return_value=False)
     @patch("app.data.loader.pd.read_csv")
@@ -266,6 +435,37 @@ class TestLoadBases:
         loader.load_bases()
         assert mock_csv.call_count == 1
 
+    @patch("app.data.loader.pd.read_csv")
+    def test_feather_cache_round_trip(self, mock_csv, tmp_path):
+        mock_csv.return_value = pd.DataFrame(
+            {
+                "Geo Point": ["INVALID", "34.91, -117.88"],
+                "COMPONENT": ["Army", "Air Force"],
+                "Site Name": pd.array(["Base A", "Base B"], dtype="string[pyarrow]"),
+                "State Terr": ["Alabama", "California"],
+                "Oper Stat": ["Active", "Active"],
+                "Joint Base": ["N/A", "N/A"],
+                "AREA": [100, 200],
+                "PERIMETER": [50, 60],
+            }
+        )
+        cache_path = str(tmp_path / "bases.feather")
+        with (
+            patch("app.data.loader.CACHE_DIR", str(tmp_path)),
+            patch("app.data.loader.BASES_CACHE", cache_path),
+            patch("app.data.loader._cache_is_fresh", return_value=False),
+        ):
+            fresh = loader.load_bases()
+        loader._cache.clear()
+        with (
+            patch("app.data.loader.BASES_CACHE", cache_path),
+            patch("app.data.loader._cache_is_fresh", return_value=True),
+        ):
+            cached = loader.load_bases()
+
+        assert mock_csv.call_count == 1
+        pd.testing.assert_frame_equal(cached, fresh.reset_index(drop=True))
+
 
 # ═══════════════════════════════════════════════════════════════════
 # load_healthcare() tests
@@ -276,7 +476,7 @@ class TestLoadHealthcare:
     """Test healthcare data loading and error handling."""
 
     @patch("app.data.loader._cache_is_fresh", return_value=False)
-    @patch("app.data.loader.pd.read_csv")
+    @patch("app.data.loader._read_healthcare_csv")
     def test_success_with_transformations(self, mock_csv, _mock_fresh):
         mock_csv.return_value = pd.DataFrame(
             {
@@ -298,14 +498,14 @@ class TestLoadHealthcare:
         assert df["keywords"].iloc[0] == "allergy, rhinitis"  # rstripped comma
 
     @patch("app.data.loader._cache_is_fresh", return_value=False)
-    @patch("app.data.loader.pd.read_csv", side_effect=FileNotFoundError)
+    @patch("app.data.loader._read_healthcare_csv", side_effect=FileNotFoundError)
     def test_file_not_found_returns_empty(self, mock_csv, _mock_fresh):
         df = loader.load_healthcare()
         assert isinstance(df, pd.DataFrame)
         assert df.empty
 
     @patch("app.data.loader._cache_is_fresh", return_value=False)
-    @patch("app.data.loader.pd.read_csv")
+    @patch("app.data.loader._read_healthcare_csv")
     def test_caching(self, mock_csv, _mock_fresh):
         mock_csv.return_value = pd.DataFrame(
             {
@@ -323,12 +523,27 @@ class TestLoadHealthcare:
         assert mock_csv.call_count == 1
 
     @patch("app.data.loader._cache_is_fresh", return_value=False)
-    @patch("app.data.loader.pd.read_csv", side_effect=pd.errors.ParserError("bad"))
+    @patch("app.data.loader._read_healthcare_csv", side_effect=pd.errors.ParserError("bad"))
     def test_parser_error_returns_empty(self, mock_csv, _mock_fresh):
         df = loader.load_healthcare()
         assert isinstance(df, pd.DataFrame)
         assert df.empty
 
+    def test_read_csv_keeps_quoted_newlines(self, tmp_path):
+        path = tmp_path / "healthcare.csv"
+        path.write_text('medical_specialty,transcription\n Surgery ,"line one\nline two"\n,x\n')
+        with patch("app.data.loader.HEALTHCARE_CSV", str(path)):
+            df = loader._read_healthcare_csv()
+        assert df["transcription"].tolist() == ["line one\nline two", "x"]
+        assert df["medical_specialty"].iloc[0] == " Surgery "
+        assert pd.isna(df["medical_specialty"].iloc[1])
+
+    def test_read_csv_raises_parser_error(self, tmp_path):
+        path = tmp_path / "healthcare.csv"
+        path.write_text("a,b\n1,2,3\n")
+        with patch("app.data.loader.HEALTHCARE_CSV", str(path)), pytest.raises(pd.errors.ParserError):
+            loader._read_healthcare_csv()
+
 
 # ═══════════════════════════════════════════════════════════════════
 # load_ecg_precomputed() tests
@@ -382,3 +597,122 @@ class TestLoadEcgPrecomputed:
         data = loader.load_ecg_precomputed()
         assert "mitbih" in data
         assert "ptbdb" in data
+
+
+class TestWarmCaches:
+    """Test concurrent cache warming."""
+
+    @patch("app.data.loader.load_healthcare")
+    @patch("app.data.loader.load_bases")
+    @patch("app.data.loader.load_equipment")
+    def test_calls_each_tabular_loader(self, mock_equipment, mock_bases, mock_healthcare):
+        loader.warm_caches()
+        mock_equipment.assert_called_once_with()
+        mock_bases.assert_called_once_with()
+        mock_healthcare.assert_called_once_with()
+
+
+class TestEcgSourcePath:
+    """Test resolution of full vs sample ECG source files."""
+
+    def test_prefers_full_file(self):
+        present = {"mitbih_train.csv", "mitbih_train_sample.csv"}
+        assert loader._ecg_source_path("mitbih_train.csv", present).endswith("mitbih_train.csv")
+
+    def test_falls_back_to_sample(self):
+        path = loader._ecg_source_path("mitbih_train.csv", {"mitbih_train_sample.csv"})
+        assert path.endswith("mitbih_train_sample.csv")
+
+    def test_missing_returns_none(self):
+        assert loader._ecg_source_path("mitbih_train.csv", set()) is None
+
+
+class TestPca2d:
+    """Test the SVD-based 2-D PCA projection."""
+
+    def test_recovers_dominant_axis(self):
+        t = np.linspace(-1, 1, 50, dtype=np.float32)
+        # Rows vary along [2, 1, 0] with a little orthogonal noise
+        matrix = np.column_stack([2 * t, t, 0.01 * np.cos(7 * t)]).astype(np.float32)
+        embedding, explained = loader._pca_2d(matrix)
+
+        assert embedding.shape == (50, 2)
+        assert explained[0] > 0.99
+        assert explained.sum() <= 1.0 + 1e-6
+        np.testing.assert_allclose(np.abs(embedding[:, 0]), np.abs(t) * np.sqrt(5), atol=1e-3)
+
+    def test_component_sign_is_deterministic(self):
+        matrix = np.random.default_rng(0).random((20, 5), dtype=np.float32)
+        first, _ = loader._pca_2d(matrix)
+        second, _ = loader._pca_2d(-matrix)
+        np.testing.assert_allclose(first, -second, atol=1e-5)
+
+
+class TestEcgSidecar:
+    """Test the JSON + Arrow sidecar ECG cache round trip."""
+
+    def test_round_trip(self, tmp_path):
+        mean = np.linspace(0, 1, 187, dtype=np.float32)
+        samples = np.random.default_rng(0).random((3, 187), dtype=np.float32)
+        split = {
+            "class_distribution": {"Normal": 3},
+            "mean_waveforms": {"Normal": mean},
+            "std_waveforms": {"Normal": mean / 2},
+            "samples": {"Normal": samples},
+            "features": {"Normal": {"energy": 1.0}},
+        }
+        result = {"ptbdb": {"class_names": {0: "Normal"}, "splits": {"train": split}}}
+        with (
+            patch("app.data.loader.ECG_CACHE", str(tmp_path / "ecg.json")),
+            patch("app.data.loader.ECG_ARRAYS_CACHE", str(tmp_path / "ecg.arrow")),
+        ):
+            loader._write_ecg_cache(result)
+            with open(tmp_path / "ecg.json") as f:
+                data = loader._attach_ecg_arrays(json.load(f))
+
+        assert "_arrays" not in data
+        loaded = data["ptbdb"]["splits"]["train"]
+        assert loaded["class_distribution"] == {"Normal": 3}
+        np.testing.assert_array_equal(loaded["mean_waveforms"]["Normal"], mean)
+        assert loaded["samples"]["Normal"].dtype == np.float32
+        np.testing.assert_allclose(loaded["samples"]["Normal"], samples, atol=0.5 / 255)
+
+    def test_pca_embedding_round_trip(self, tmp_path):
+        split = {
+            field: {} for field in ("class_distribution", "mean_waveforms", "std_waveforms", "samples", "features")
+        }
+        embedding = np.array([[0.5, -1.0], [1.5, 2.0]])
+        pca = {"x": embedding[:, 0], "y": embedding[:, 1], "labels": ["A", "B"], "explained_variance": [0.6, 0.3]}
+        result = {"mitbih": {"splits": {"train": split}, "pca_embedding": pca}}
+        with (
+            patch("app.data.loader.ECG_CACHE", str(tmp_path / "ecg.json")),
+            patch("app.data.loader.ECG_ARRAYS_CACHE", str(tmp_path / "ecg.arrow")),
+        ):
+            loader._write_ecg_cache(result)
+            with open(tmp_path / "ecg.json") as f:
+                data = loader._attach_ecg_arrays(json.load(f))
+
+        loaded = data["mitbih"]["pca_embedding"]
+        np.testing.assert_array_equal(loaded["x"], [0.5, 1.5])
+        np.testing.assert_array_equal(loaded["y"], [-1.0, 2.0])
+        assert loaded["labels"] == ["A", "B"]
+
+    def test_rewrite_replaces_files_instead_of_truncating(self, tmp_path):
+        split = {
+            field: {} for field in ("class_distribution", "mean_waveforms", "std_waveforms", "samples", "features")
+        }
+        pca = {"x": np.array([1.0, 2.0]), "y": np.array([3.0, 4.0]), "labels": ["A", "B"]}
+        result = {"mitbih": {"splits": {"train": split}, "pca_embedding": pca}}
+        with (
+            patch("app.data.loader.ECG_CACHE", str(tmp_path / "ecg.json")),
+            patch("app.data.loader.ECG_ARRAYS_CACHE", str(tmp_path / "ecg.arrow")),
+        ):
+            loader._write_ecg_cache(result)
+            # Views into the mapped sidecar, as another worker would hold them
+            mapped = loader._read_ecg_arrays(str(tmp_path / "ecg.arrow"))
+            inode = os.stat(tmp_path / "ecg.arrow").st_ino
+            loader._write_ecg_cache(result)
+
+        assert os.stat(tmp_path / "ecg.arrow").st_ino != inode
+        np.testing.assert_array_equal(mapped["mitbih.pca.x"], [1.0, 2.0])
+        assert sorted(os.listdir(tmp_path)) == ["ecg.arrow", "ecg.json"]
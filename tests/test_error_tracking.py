@@ -1,5 +1,7 @@
 """Tests for the error tracking integration pattern."""
 
+import logging
+
 import pytest
 
 from app import metrics
@@ -32,16 +34,25 @@ class TestErrorTrackingWithoutSentry:
         assert data["counters"]["errors_total"] == 1
 
     def test_capture_exception_with_no_active_exception(self):
-        # Should not raise even when there's no active exception
+        # Should not raise or count an error when there's no active exception
         capture_exception()
         data = metrics.get_metrics()
-        assert data["counters"]["errors_total"] == 1
+        assert "errors_total" not in data["counters"]
 
     def test_capture_message_does_not_raise(self):
         # Should log without error
         capture_message("Test warning", level="warning")
         capture_message("Test info", level="info")
 
+    def test_capture_message_respects_logger_level(self, caplog):
+        from app import error_tracking
+
+        caplog.set_level(logging.WARNING, logger=error_tracking.logger.name)
+        capture_message("quiet", level="info")
+        capture_message("loud", level="fatal")
+        messages = [(r.levelno, r.getMessage()) for r in caplog.records if r.name == error_tracking.logger.name]
+        assert messages == [(logging.CRITICAL, "Error tracking message: loud")]
+
     def test_multiple_exceptions_increment_counter(self):
         for i in range(3):
             try:
@@ -51,3 +62,38 @@ class TestErrorTrackingWithoutSentry:
 
         data = metrics.get_metrics()
         assert data["counters"]["errors_total"] == 3
+
+
+class TestErrorTrackingWithSentry:
+    """Tests for error tracking with a Sentry SDK configured."""
+
+    @pytest.fixture
+    def fake_sentry(self, monkeypatch):
+        import sys
+        import types
+
+        from app import error_tracking
+
+        calls = []
+        sdk = types.SimpleNamespace(
+            init=lambda **kwargs: None,
+            capture_exception=lambda exc: calls.append(("exception", exc)),
+            capture_message=lambda message, level: calls.append(("message", message, level)),
+        )
+        monkeypatch.setitem(sys.modules, "sentry_sdk", sdk)
+        monkeypatch.setenv("SENTRY_DSN", "https://key@example.invalid/1")
+        for name in ("_sentry_initialized", "_sentry_capture_exception", "_sentry_capture_message"):
+            monkeypatch.setattr(error_tracking, name, getattr(error_tracking, name))
+        init_error_tracking()
+        return calls
+
+    def test_captures_are_forwarded(self, fake_sentry):
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError as exc:
+            error = exc
+            capture_exception()
+        capture_message("heads up", level="warning")
+
+        assert fake_sentry == [("exception", error), ("message", "heads up", "warning")]
+        assert metrics.get_metrics()["counters"]["errors_total"] == 1
@@ -1,6 +1,7 @@
 """Tests for the health check endpoint."""
 
 import json
+import os
 
 import pytest
 
@@ -59,3 +60,85 @@ class TestHealthEndpoint:
         data = json.loads(response.data)
         assert "all_caches_warm" in data
         assert isinstance(data["all_caches_warm"], bool)
+
+
+class TestHealthProbe:
+    """Tests for the scandir-based cache probe."""
+
+    def test_probe_reports_cache_files(self, tmp_path, monkeypatch):
+        from app import health
+
+        (tmp_path / "equipment.parquet").write_bytes(b"x" * 10)
+        monkeypatch.setattr(health, "CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(health, "_CACHE_FILES", {"equipment": str(tmp_path / "equipment.parquet"), "ecg": "x.json"})
+        cache_status, cache_dir_exists, _ = health._probe_filesystem()
+        assert cache_dir_exists is True
+        assert cache_status["equipment"] == {"exists": True, "size_bytes": 10}
+        assert cache_status["ecg"] == {"exists": False, "size_bytes": 0}
+
+    def test_probe_missing_cache_dir(self, tmp_path, monkeypatch):
+        from app import health
+
+        monkeypatch.setattr(health, "CACHE_DIR", str(tmp_path / "missing"))
+        cache_status, cache_dir_exists, _ = health._probe_filesystem()
+        assert cache_dir_exists is False
+        assert not any(s["exists"] for s in cache_status.values())
+
+    def test_probe_unreadable_cache_dir(self, monkeypatch):
+        from app import health
+
+        def deny(path):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(health.os, "scandir", deny)
+        cache_status, cache_dir_exists, _ = health._probe_filesystem()
+        assert cache_dir_exists is False
+        assert not any(s["exists"] for s in cache_status.values())
+
+    def test_probe_skips_entries_that_fail_stat(self, tmp_path, monkeypatch):
+        from app import health
+
+        class Entry:
+            def __init__(self, name, size=None):
+                self.name = name
+                self._size = size
+
+            def is_file(self):
+                return True
+
+            def stat(self):
+                if self._size is None:
+                    raise FileNotFoundError(self.name)
+                return os.stat_result((0, 0, 0, 0, 0, 0, self._size, 0, 0, 0))
+
+        class Scan:
+            def __enter__(self):
+                return iter([Entry("equipment.parquet"), Entry("bases.feather", 7)])
+
+            def __exit__(self, *args):
+                return False
+
+        monkeypatch.setattr(health.os, "scandir", lambda path: Scan())
+        cache_status, cache_dir_exists, _ = health._probe_filesystem()
+        assert cache_dir_exists is True
+        assert cache_status["equipment"] == {"exists": False, "size_bytes": 0}
+        assert cache_status["bases"] == {"exists": True, "size_bytes": 7}
+
+    def test_probe_result_is_memoized(self, monkeypatch):
+        from app import health
+
+        calls = []
+        monkeypatch.setattr(health, "_cache", (0.0, None))
+        monkeypatch.setattr(health, "_probe_filesystem", lambda: calls.append(1) or ({}, True, True))
+        health._cached_probe()
+        health._cached_probe()
+        assert len(calls) == 1
+
+    def test_datasets_probe_is_memoized(self, tmp_path, monkeypatch):
+        from app import health
+
+        monkeypatch.setattr(health, "_datasets_probe", (0.0, None))
+        monkeypatch.setattr(health, "DATASET_DIR", str(tmp_path))
+        assert health._datasets_available() is True
+        monkeypatch.setattr(health, "DATASET_DIR", str(tmp_path / "missing"))
+        assert health._datasets_available() is True
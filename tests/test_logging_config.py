@@ -75,6 +75,22 @@ class TestJSONFormatter:
         assert parsed["duration_ms"] == 45.2
         assert parsed["component"] == "health"
 
+    def test_timestamp_is_utc(self):
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="app.test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Tick",
+            args=(),
+            exc_info=None,
+        )
+        record.created = 0.25
+
+        parsed = json.loads(formatter.format(record))
+        assert parsed["timestamp"] == "1970-01-01T00:00:00.250Z"
+
     def test_json_single_line(self):
         formatter = JSONFormatter()
         record = logging.LogRecord(
@@ -137,12 +153,84 @@ class TestSetupLogging:
         logger = setup_logging(level=logging.DEBUG)
         assert isinstance(logger.handlers[0].formatter, TextFormatter)
 
+    def test_setup_with_queue(self, tmp_path, monkeypatch):
+        from logging.handlers import QueueHandler
+
+        from app import logging_config
+
+        monkeypatch.setattr(logging_config, "LOG_FILE", str(tmp_path / "app.log"))
+        logger = setup_logging(level=logging.DEBUG, log_format="json", use_queue=True)
+        try:
+            assert len(logger.handlers) == 1
+            assert isinstance(logger.handlers[0], QueueHandler)
+            try:
+                raise ValueError("queued")
+            except ValueError:
+                logger.error("Queued %s", "record", exc_info=True)
+        finally:
+            logging_config._stop_queue_listener()
+            logger.handlers.clear()
+
+        parsed = json.loads((tmp_path / "app.log").read_text().splitlines()[-1])
+        assert parsed["message"] == "Queued record"
+        assert "ValueError" in parsed["exception"]
+
+    def test_queue_resolves_message_on_calling_thread(self):
+        import queue
+
+        from app.logging_config import _RecordQueueHandler
+
+        log_queue = queue.SimpleQueue()
+        handler = _RecordQueueHandler(log_queue)
+        payload = {"state": "before"}
+        record = logging.LogRecord("app.test", logging.INFO, "test.py", 1, "Payload %s", (payload,), None)
+        handler.emit(record)
+        payload["state"] = "after"
+
+        queued = log_queue.get_nowait()
+        assert queued is not record
+        assert queued.getMessage() == "Payload {'state': 'before'}"
+        assert queued.args is None
+
     def test_suppresses_third_party_loggers(self):
         setup_logging(level=logging.DEBUG, log_format="text")
         assert logging.getLogger("werkzeug").level == logging.WARNING
         assert logging.getLogger("dash").level == logging.WARNING
 
 
+class TestBytesRotatingFileHandler:
+    """Tests for the byte-level rotating file handler."""
+
+    def _record(self, msg):
+        return logging.LogRecord("app.test", logging.INFO, "test.py", 1, msg, (), None)
+
+    def test_writes_utf8_lines(self, tmp_path):
+        from app.logging_config import _BytesRotatingFileHandler
+
+        path = tmp_path / "app.log"
+        handler = _BytesRotatingFileHandler(str(path), maxBytes=1024, backupCount=1)
+        try:
+            handler.emit(self._record("héllo"))
+            handler.emit(self._record("wörld"))
+        finally:
+            handler.close()
+        assert path.read_text(encoding="utf-8") == "héllo\nwörld\n"
+
+    def test_rolls_over_on_byte_size(self, tmp_path):
+        from app.logging_config import _BytesRotatingFileHandler
+
+        path = tmp_path / "app.log"
+        handler = _BytesRotatingFileHandler(str(path), maxBytes=20, backupCount=1)
+        try:
+            # 6 characters but 11 bytes per line once UTF-8 encoded
+            handler.emit(self._record("ééééé"))
+            handler.emit(self._record("ééééé"))
+        finally:
+            handler.close()
+        assert (tmp_path / "app.log.1").read_text(encoding="utf-8") == "ééééé\n"
+        assert path.read_text(encoding="utf-8") == "ééééé\n"
+
+
 class TestGetLogger:
     """Tests for the get_logger helper."""
 
@@ -1,6 +1,7 @@
 """Tests for the application metrics collection module."""
 
 import json
+import threading
 import time
 
 import pytest
@@ -43,6 +44,25 @@ class TestCounters:
         assert data["counters"]["cache_hits{dataset=equipment,layer=memory}"] == 1
         assert data["counters"]["cache_hits{dataset=bases,layer=parquet}"] == 1
 
+    def test_increment_mixed_values_share_key(self):
+        metrics.increment("rows")
+        metrics.increment("rows", value=5)
+        metrics.increment("rows")
+        data = metrics.get_metrics()
+        assert data["counters"]["rows"] == 7
+
+    def test_increment_concurrent(self):
+        def worker():
+            for _ in range(1000):
+                metrics.increment("concurrent")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert metrics.get_metrics()["counters"]["concurrent"] == 8000
+
 
 class TestHistograms:
     """Tests for histogram (timing) metrics."""
@@ -127,3 +147,10 @@ class TestMetricsEndpoint:
         data = json.loads(response.data)
         assert "counters" in data
         assert "histograms" in data
+
+    def test_metrics_json_without_orjson(self, client, monkeypatch):
+        monkeypatch.setattr(metrics, "orjson", None)
+        metrics.increment("hits", value=2)
+        response = client.get("/metrics")
+        assert response.mimetype == "application/json"
+        assert json.loads(response.data)["counters"]["hits"] == 2